@@ -20,16 +20,26 @@ Requirements:
 """
 
 import argparse
+import atexit
 import logging
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Deque, Iterator, List, Optional, Tuple
+
+import comic_files
+import zip_entries
 
 try:
     import patoolib
@@ -45,45 +55,85 @@ except ImportError:
     print("Error: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+# Optional libdeflate bindings for faster DEFLATE of recompressed entries
+HAS_DEFLATE = False
+try:
+    import deflate  # libdeflate
+    HAS_DEFLATE = True
+except ImportError:
+    HAS_DEFLATE = False
+
+# Optional pure-Python RAR reader for converting without a temp directory
+HAS_RARFILE = False
+try:
+    import rarfile
+    HAS_RARFILE = True
+except ImportError:
+    HAS_RARFILE = False
+
+# Batch conversions log a progress summary every this many files
+PROGRESS_LOG_INTERVAL = 100
+
+# Leading bytes of a ZIP local file header and of a RAR archive
+ZIP_MAGIC = b'PK\x03\x04'
+RAR_MAGIC = b'Rar!'
+
 
 class CBRToCBZConverter:
     """Converts CBR files to CBZ format."""
 
-    def __init__(self, create_backups: bool = True, overwrite: bool = False):
+    _IMAGE_EXTS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp', 'tiff'})
+
+    def __init__(self, create_backups: bool = True, overwrite: bool = False,
+                 recompress_images: bool = False, compress_level: int = 1,
+                 jobs: Optional[int] = None):
         """
         Initialize the converter.
 
         Args:
             create_backups: Whether to create backup copies of original CBR files
             overwrite: Whether to overwrite existing CBZ files
+            recompress_images: Whether to DEFLATE image entries instead of storing them
+            compress_level: DEFLATE level (1-9) for compressed entries; 1 is fastest
+            jobs: Worker count for batch conversions and page copies (default: CPU count)
         """
         self.create_backups = create_backups
         self.overwrite = overwrite
+        self.recompress_images = recompress_images
+        self.compress_level = compress_level
+        self.jobs = jobs or os.cpu_count() or 1
         self.backup_dir = "backups"
+        # Shared by every backup made during a run instead of re-sampling the clock
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        _start_log_listener()
         self.logger = logging.getLogger(__name__)
 
     def _is_image_file(self, filename: str) -> bool:
         """Check if a file is a supported image format."""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff'}
-        return Path(filename).suffix.lower() in image_extensions
+        _stem, dot, ext = filename.rpartition('.')
+        return bool(dot) and ext.lower() in self._IMAGE_EXTS
+
+    def _backup_path(self, cbr_path: Path) -> Path:
+        """Return a free timestamped path for cbr_path in its backups folder."""
+        backup_dir = cbr_path.parent / self.backup_dir
+        backup_dir.mkdir(exist_ok=True)
+
+        backup_path = backup_dir / f"{cbr_path.stem}_backup_{self.run_timestamp}{cbr_path.suffix}"
+        counter = 1
+        while backup_path.exists():
+            # The run timestamp is reused, so disambiguate repeat runs within the same second
+            backup_path = backup_dir / f"{cbr_path.stem}_backup_{self.run_timestamp}_{counter}{cbr_path.suffix}"
+            counter += 1
+        return backup_path
 
     def _create_backup(self, cbr_path: Path) -> Optional[Path]:
         """Create a backup of the original CBR file."""
         if not self.create_backups:
             return None
 
-        backup_dir = cbr_path.parent / self.backup_dir
-        backup_dir.mkdir(exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{cbr_path.stem}_backup_{timestamp}{cbr_path.suffix}"
-        backup_path = backup_dir / backup_name
+        backup_path = self._backup_path(cbr_path)
 
         try:
             shutil.copy2(cbr_path, backup_path)
@@ -101,16 +151,17 @@ class CBRToCBZConverter:
         if not self.create_backups:
             return None
 
-        backup_dir = cbr_path.parent / self.backup_dir
-        backup_dir.mkdir(exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{cbr_path.stem}_backup_{timestamp}{cbr_path.suffix}"
-        dest_path = backup_dir / backup_name
+        dest_path = self._backup_path(cbr_path)
 
         try:
-            shutil.move(str(cbr_path), str(dest_path))
-            self.logger.info(f"Moved original to backup: {dest_path}")
+            try:
+                # The backups folder sits next to the original, so this is
+                # normally an O(1) rename on the same filesystem
+                os.replace(cbr_path, dest_path)
+            except OSError:
+                # e.g. backups is a mount point on another device
+                shutil.move(str(cbr_path), str(dest_path))
+            self.logger.debug(f"Moved original to backup: {dest_path}")
             return dest_path
         except Exception as e:
             self.logger.error(f"Failed to move original to backup: {e}")
@@ -144,8 +195,12 @@ class CBRToCBZConverter:
     def _extract_cbr(self, cbr_path: Path, extract_dir: Path) -> bool:
         """Extract CBR file to temporary directory.
 
-        Tries patool first; if it fails, falls back to 7-Zip if available.
+        Runs unrar directly when it is installed, then tries patool, and
+        finally falls back to 7-Zip if available.
         """
+        if self._extract_with_unrar(cbr_path, extract_dir):
+            return True
+
         try:
             patoolib.extract_archive(str(cbr_path), outdir=str(extract_dir))
             return True
@@ -158,6 +213,40 @@ class CBRToCBZConverter:
             self.logger.error(f"Failed to extract {cbr_path} with patool and 7-Zip fallback")
             return False
 
+    def _find_unrar(self) -> Optional[str]:
+        """Find an unrar executable on PATH or common install locations."""
+        path = shutil.which("unrar")
+        if path:
+            return path
+        # Common Windows locations
+        common_paths = [
+            r"C:\\Program Files\\WinRAR\\UnRAR.exe",
+            r"C:\\Program Files (x86)\\WinRAR\\UnRAR.exe",
+        ]
+        for p in common_paths:
+            if Path(p).exists():
+                return p
+        return None
+
+    def _extract_with_unrar(self, archive_path: Path, extract_dir: Path) -> bool:
+        """Extract archive by calling unrar directly, bypassing patool."""
+        unrar = self._find_unrar()
+        if not unrar:
+            self.logger.debug("unrar not found on system PATH or common locations")
+            return False
+        # x = extract with paths, -o+ = overwrite, -inul = no output; the
+        # trailing separator tells unrar the destination is a directory
+        cmd = [unrar, "x", "-o+", "-inul", str(archive_path), f"{extract_dir}{os.sep}"]
+        try:
+            result = subprocess.run(cmd, capture_output=True)
+            if result.returncode == 0:
+                return True
+            self.logger.debug(f"unrar extraction failed (code {result.returncode}) for {archive_path}")
+            return False
+        except Exception as e:
+            self.logger.debug(f"Error running unrar: {e}")
+            return False
+
     def _find_7z(self) -> Optional[str]:
         """Find a 7-Zip executable on PATH or common install locations."""
         candidates = ["7z", "7za", "7zr"]
@@ -197,38 +286,208 @@ class CBRToCBZConverter:
     def _create_cbz(self, source_dir: Path, cbz_path: Path) -> bool:
         """Create CBZ file from extracted images."""
         try:
-            # Get all image files and sort them naturally
-            image_files = []
-            for root, _dirs, files in os.walk(source_dir):
-                for file in files:
-                    if self._is_image_file(file):
-                        image_files.append(Path(root) / file)
-
-            if not image_files:
+            # Create CBZ archive. Images are already compressed (JPEG/PNG/WebP),
+            # so store them as-is unless recompression was explicitly requested.
+            image_compression = zipfile.ZIP_DEFLATED if self.recompress_images else zipfile.ZIP_STORED
+            image_count = 0
+            with zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_STORED) as cbz:
+                images = self._iter_images(str(source_dir))
+                if self.jobs > 1:
+                    image_count = self._write_entries_parallel(cbz, images, image_compression)
+                else:
+                    for arcname, entry in images:
+                        if image_compression == zipfile.ZIP_STORED:
+                            self._write_stored_entry(cbz, entry, arcname)
+                        elif HAS_DEFLATE:
+                            self._write_libdeflate_entry(cbz, entry, arcname)
+                        else:
+                            cbz.write(entry.path, arcname, compress_type=image_compression, compresslevel=self.compress_level)
+                        image_count += 1
+
+            if not image_count:
                 self.logger.warning(f"No image files found in {source_dir}")
+                cbz_path.unlink()
                 return False
 
-            # Sort files naturally (handle numeric sequences properly)
-            image_files.sort(key=lambda x: self._natural_sort_key(x.name))
-
-            # Create CBZ archive
-            with zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_DEFLATED) as cbz:
-                for img_path in image_files:
-                    # Preserve directory structure relative to source_dir
-                    arcname = img_path.relative_to(source_dir)
-                    cbz.write(img_path, arcname)
-
-            self.logger.info(f"Created CBZ with {len(image_files)} images: {cbz_path}")
+            self.logger.debug(f"Created CBZ with {image_count} images: {cbz_path}")
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to create CBZ {cbz_path}: {e}")
             return False
 
-    def _natural_sort_key(self, text: str) -> List:
-        """Generate a key for natural sorting (handles numbers in filenames)."""
-        import re
-        return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', text)]
+    def _iter_images(self, directory: str, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (arcname, entry) for images under directory in natural order.
+
+        Entries are sorted one directory at a time and subdirectories are
+        walked as they are reached, preserving the structure relative to the
+        extraction root without materializing the whole tree.
+        """
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: comic_files.natural_key(e.name))
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._iter_images(entry.path, f"{prefix}{entry.name}/")
+            elif self._is_image_file(entry.name):
+                yield f"{prefix}{entry.name}", entry
+
+    def _zipinfo_from_entry(self, entry: os.DirEntry, arcname: str) -> zipfile.ZipInfo:
+        """Build a ZipInfo from the stat result scandir already fetched."""
+        st = entry.stat()
+        date_time = time.localtime(st.st_mtime)[:6]
+        if date_time[0] < 1980:
+            # ZIP timestamps cannot represent dates before 1980
+            date_time = (1980, 1, 1, 0, 0, 0)
+        zinfo = zipfile.ZipInfo(arcname, date_time)
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.file_size = st.st_size
+        return zinfo
+
+    def _write_stored_entry(self, cbz: zipfile.ZipFile, entry: os.DirEntry, arcname: str) -> None:
+        """Copy an image into the archive uncompressed without re-stat'ing it."""
+        zinfo = self._zipinfo_from_entry(entry, arcname)
+        zinfo.compress_type = zipfile.ZIP_STORED
+        with open(entry.path, 'rb', buffering=0) as src, cbz.open(zinfo, 'w') as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
+    def _write_libdeflate_entry(self, cbz: zipfile.ZipFile, entry: os.DirEntry, arcname: str) -> None:
+        """Write a DEFLATE entry compressed with libdeflate instead of zlib.
+
+        zipfile cannot accept pre-compressed data, so the local header and
+        payload are written directly and the entry is registered with the
+        ZipFile so its central directory is emitted on close.
+        """
+        self._write_prepared_entry(cbz, *self._prepare_entry(entry, arcname, zipfile.ZIP_DEFLATED))
+
+    def _prepare_entry(self, entry: os.DirEntry, arcname: str,
+                       compress_type: int) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Read (and DEFLATE if requested) one image, returning its ZipInfo and payload.
+
+        Safe to run in worker threads: file reads, crc32 and compression all
+        release the GIL.
+        """
+        with open(entry.path, 'rb') as src:
+            data = src.read()
+
+        if compress_type == zipfile.ZIP_DEFLATED:
+            if HAS_DEFLATE:
+                payload = deflate.deflate_compress(data, self.compress_level)
+            else:
+                # Raw DEFLATE stream (negative wbits) as stored in ZIP entries
+                compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, -15)
+                payload = compressor.compress(data) + compressor.flush()
+        else:
+            payload = data
+
+        zinfo = self._zipinfo_from_entry(entry, arcname)
+        zinfo.compress_type = compress_type
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(payload)
+        zinfo.CRC = zlib.crc32(data)
+        return zinfo, payload
+
+    def _write_prepared_entry(self, cbz: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes) -> None:
+        """Write a local header and payload produced by _prepare_entry."""
+        zip_entries.write_entry(cbz, zinfo, (payload,))
+
+    def _write_entries_parallel(self, cbz: zipfile.ZipFile,
+                                images: Iterator[Tuple[str, os.DirEntry]],
+                                compress_type: int) -> int:
+        """Prepare entries on a thread pool and write them in order from this thread.
+
+        ZipFile itself is not thread-safe, so workers only read (and compress)
+        pages; at most jobs * 2 prepared pages are held in memory at once.
+        """
+        count = 0
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for arcname, entry in images:
+                pending.append(executor.submit(self._prepare_entry, entry, arcname, compress_type))
+                if len(pending) >= self.jobs * 2:
+                    self._write_prepared_entry(cbz, *pending.popleft().result())
+                    count += 1
+            while pending:
+                self._write_prepared_entry(cbz, *pending.popleft().result())
+                count += 1
+        return count
+
+    def _extract_and_pack(self, cbr_path: Path, cbz_path: Path) -> bool:
+        """Copy images from the RAR straight into a new CBZ without a temp dir.
+
+        Returns False (leaving no partial CBZ behind) when rarfile is not
+        installed, images are being recompressed, any page is compressed, or
+        the archive cannot be read, so the caller can fall back to
+        extract-then-pack.
+        """
+        if not HAS_RARFILE or self.recompress_images:
+            return False
+
+        try:
+            with rarfile.RarFile(str(cbr_path)) as rf:
+                infos = [
+                    info for info in rf.infolist()
+                    if not info.is_dir() and self._is_image_file(info.filename)
+                ]
+                # rarfile runs one unrar process per compressed member, and on
+                # a solid archive each of those decompresses everything before
+                # it; a single unrar extraction is far cheaper then
+                if not infos or rf.is_solid() or any(
+                    info.compress_type != rarfile.RAR_M0 for info in infos
+                ):
+                    return False
+                # Natural order per path component, matching _iter_images
+                infos.sort(key=lambda info: [comic_files.natural_key(part) for part in info.filename.split('/')])
+
+                with zipfile.ZipFile(cbz_path, 'w', zipfile.ZIP_STORED) as cbz:
+                    for info in infos:
+                        zinfo = zipfile.ZipInfo(
+                            info.filename,
+                            info.date_time or (1980, 1, 1, 0, 0, 0)
+                        )
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                        zinfo.file_size = info.file_size
+                        with rf.open(info) as src, cbz.open(zinfo, 'w') as dst:
+                            shutil.copyfileobj(src, dst, length=1 << 20)
+
+            self.logger.debug(f"Created CBZ with {len(infos)} images: {cbz_path}")
+            return True
+        except Exception as e:
+            self.logger.debug(f"Streaming conversion unavailable for {cbr_path}: {e}")
+            cbz_path.unlink(missing_ok=True)
+            return False
+
+    def _extraction_temp_root(self, cbr_path: Path) -> Optional[str]:
+        """Return a RAM-backed directory for extraction if one has room, else None.
+
+        Extracting into /dev/shm avoids writing every page to disk only to read
+        it back when building the CBZ. None means the system default temp dir.
+        """
+        shm = "/dev/shm"
+        if not os.path.isdir(shm) or not os.access(shm, os.W_OK):
+            return None
+        try:
+            # Leave headroom for the extracted pages plus other workers
+            if shutil.disk_usage(shm).free > cbr_path.stat().st_size * 3:
+                return shm
+        except OSError:
+            pass
+        return None
+
+    def _convert_via_temp_dir(self, cbr_path: Path, cbz_path: Path,
+                              temp_root: Optional[str]) -> Tuple[bool, str]:
+        """Extract the CBR into a temporary directory under temp_root and pack the CBZ from it."""
+        with tempfile.TemporaryDirectory(dir=temp_root) as temp_dir:
+            temp_path = Path(temp_dir)
+
+            # Extract CBR
+            if not self._extract_cbr(cbr_path, temp_path):
+                return False, f"Failed to extract CBR: {cbr_path}"
+
+            # Create CBZ
+            if not self._create_cbz(temp_path, cbz_path):
+                return False, f"Failed to create CBZ: {cbz_path}"
+        return True, ""
 
     def convert_file(self, cbr_path: Path) -> Tuple[bool, str]:
         """
@@ -246,9 +505,15 @@ class CBRToCBZConverter:
         if cbr_path.suffix.lower() != '.cbr':
             return False, f"Not a CBR file: {cbr_path}"
 
-        # If the .cbr is actually a ZIP archive, just rename to .cbz
+        # If the .cbr is actually a ZIP archive, just rename to .cbz. A local
+        # header signature at offset 0 settles it without reading the central
+        # directory; is_zipfile covers ZIPs with data prepended.
         try:
-            if zipfile.is_zipfile(cbr_path):
+            with open(cbr_path, 'rb') as f:
+                magic = f.read(4)
+            if magic == ZIP_MAGIC:
+                return self._rename_to_cbz(cbr_path)
+            if magic != RAR_MAGIC and zipfile.is_zipfile(cbr_path):
                 return self._rename_to_cbz(cbr_path)
         except Exception as e:
             # If zipfile check itself errors, log and continue with normal flow
@@ -260,25 +525,26 @@ class CBRToCBZConverter:
         if cbz_path.exists() and not self.overwrite:
             return False, f"CBZ already exists (use --overwrite to replace): {cbz_path}"
 
-        self.logger.info(f"Converting: {cbr_path}")
-
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract CBR
-            if not self._extract_cbr(cbr_path, temp_path):
-                return False, f"Failed to extract CBR: {cbr_path}"
-
-            # Create CBZ
-            if not self._create_cbz(temp_path, cbz_path):
-                return False, f"Failed to create CBZ: {cbz_path}"
-
-            # Move original to backups only after successful CBZ creation
-            moved_path = self._move_original_to_backup(cbr_path)
-            if self.create_backups and moved_path is None:
-                # CBZ was created but original wasn't moved; report partial issue
-                self.logger.warning("CBZ created but failed to move original to backups")
+        self.logger.debug(f"Converting: {cbr_path}")
+
+        # Stream pages straight from the RAR into the CBZ when rarfile can,
+        # otherwise extract to a temporary directory and pack from there
+        if not self._extract_and_pack(cbr_path, cbz_path):
+            temp_root = self._extraction_temp_root(cbr_path)
+            ok, message = self._convert_via_temp_dir(cbr_path, cbz_path, temp_root)
+            if not ok and temp_root is not None:
+                # Other workers share /dev/shm, so it can fill up after the
+                # free space check; try again on disk
+                self.logger.debug(f"Retrying {cbr_path} in the default temp dir")
+                ok, message = self._convert_via_temp_dir(cbr_path, cbz_path, None)
+            if not ok:
+                return False, message
+
+        # Move original to backups only after successful CBZ creation
+        moved_path = self._move_original_to_backup(cbr_path)
+        if self.create_backups and moved_path is None:
+            # CBZ was created but original wasn't moved; report partial issue
+            self.logger.warning("CBZ created but failed to move original to backups")
 
         return True, f"Successfully converted: {cbr_path} -> {cbz_path}"
 
@@ -297,10 +563,7 @@ class CBRToCBZConverter:
             return 0, 0, [f"Directory not found: {directory}"]
 
         # Find all CBR files
-        if recursive:
-            cbr_files = list(directory.rglob("*.cbr"))
-        else:
-            cbr_files = list(directory.glob("*.cbr"))
+        cbr_files = [Path(p) for p in _iter_suffix(str(directory), '.cbr', recursive)]
 
         if not cbr_files:
             return 0, 0, [f"No CBR files found in: {directory}"]
@@ -310,24 +573,121 @@ class CBRToCBZConverter:
         errors = []
 
         self.logger.info(f"Found {len(cbr_files)} CBR files to convert")
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        pending = []
         for cbr_file in cbr_files:
             # skip files already in backup folders
             if cbr_file.parent.name == self.backup_dir:
                 self.logger.debug(f"Skipping file in backup folder: {cbr_file}")
                 continue
-            success, message = self.convert_file(cbr_file)
-            if success:
-                successful += 1
-                self.logger.info(message)
-            else:
-                failed += 1
-                errors.append(message)
-                self.logger.error(message)
+            pending.append(cbr_file)
+
+        # Each conversion is independent (own temp dir and output), so fan the
+        # CPU-bound extract/repack work out across processes.
+        settings = (
+            self.create_backups, self.overwrite, self.recompress_images,
+            self.compress_level, self.backup_dir, self.run_timestamp,
+        )
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker_logging,
+            initargs=(logging.getLogger().level,),
+        ) as executor:
+            futures = {executor.submit(_convert_one, cbr_file, *settings): cbr_file for cbr_file in pending}
+            for future in as_completed(futures):
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    # A crashed worker (BrokenProcessPool) fails the remaining
+                    # files one by one instead of aborting the whole batch
+                    success, message = False, f"Error converting {futures[future]}: {e}"
+                if success:
+                    successful += 1
+                    self.logger.debug(message)
+                else:
+                    failed += 1
+                    errors.append(message)
+                    self.logger.error(message)
+                done = successful + failed
+                if done % PROGRESS_LOG_INTERVAL == 0 or done == len(pending):
+                    self.logger.info(f"Processed {done}/{len(pending)} files ({failed} failed)")
 
         return successful, failed, errors
 
 
+def _iter_suffix(root: str, suffix: str, recursive: bool) -> Iterator[str]:
+    """Yield paths of files under root whose name ends with suffix (case-insensitive).
+
+    Uses os.scandir so file type checks come from the cached directory
+    entry instead of a stat per path.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith(suffix):
+                    yield entry.path
+
+
+_log_listener: Optional[QueueListener] = None
+
+
+def _start_log_listener() -> None:
+    """Route log records through a queue so output happens on a background thread.
+
+    Like logging.basicConfig, this leaves an already configured root logger alone.
+    """
+    global _log_listener
+    root = logging.getLogger()
+    if _log_listener is not None or root.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    root.addHandler(QueueHandler(log_queue))
+    # Default to INFO, but keep a level the caller chose (e.g. DEBUG for -v)
+    if root.level in (logging.NOTSET, logging.WARNING):
+        root.setLevel(logging.INFO)
+
+    _log_listener = QueueListener(log_queue, handler)
+    _log_listener.start()
+    # Flush anything still queued before the interpreter exits
+    atexit.register(_log_listener.stop)
+
+
+def _init_worker_logging(level: int) -> None:
+    """Configure logging once in each worker process."""
+    # force replaces a forked copy of the parent's QueueHandler, whose
+    # listener thread does not exist in this process
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        force=True
+    )
+    logging.getLogger().setLevel(level)
+
+
+def _convert_one(cbr_path: Path, create_backups: bool, overwrite: bool,
+                 recompress_images: bool, compress_level: int, backup_dir: str,
+                 run_timestamp: str) -> Tuple[bool, str]:
+    """Convert a single CBR file in a worker process."""
+    converter = CBRToCBZConverter(
+        create_backups=create_backups,
+        overwrite=overwrite,
+        recompress_images=recompress_images,
+        compress_level=compress_level,
+        jobs=1  # files are already spread across processes
+    )
+    converter.backup_dir = backup_dir
+    converter.run_timestamp = run_timestamp
+    return converter.convert_file(cbr_path)
+
+
 def main() -> None:
     """Command-line interface for CBR to CBZ conversion."""
     parser = argparse.ArgumentParser(
@@ -367,6 +727,29 @@ Examples:
         help='Overwrite existing CBZ files'
     )
 
+    parser.add_argument(
+        '--recompress-images',
+        action='store_true',
+        help='DEFLATE image entries instead of storing them uncompressed (slower, rarely smaller)'
+    )
+
+    parser.add_argument(
+        '--compress-level',
+        type=int,
+        choices=range(1, 10),
+        default=1,
+        metavar='{1-9}',
+        help='DEFLATE level for compressed entries (default: 1; higher levels are '
+             'several times slower for a few percent smaller output)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Number of parallel workers (default: number of CPUs)'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -382,7 +765,10 @@ Examples:
     # Initialize converter
     converter = CBRToCBZConverter(
         create_backups=not args.no_backup,
-        overwrite=args.overwrite
+        overwrite=args.overwrite,
+        recompress_images=args.recompress_images,
+        compress_level=args.compress_level,
+        jobs=args.jobs
     )
 
     input_path = Path(args.input)
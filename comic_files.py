@@ -0,0 +1,53 @@
+"""File name and cache helpers shared by the readers and cbr2cbz."""
+
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import List, Optional, Union
+
+# Splits a file name into text and digit runs for natural sorting
+_split_digits = re.compile(r'(\d+)').split
+
+
+def natural_key(name: str) -> List[Union[int, str]]:
+    """Sort key for a file name in natural order, so page2 comes before page10."""
+    return [int(part) if part.isdigit() else part.lower() for part in _split_digits(name)]
+
+
+def member_target(dest_dir: str, filename: str) -> Optional[str]:
+    """Map an archive member name to a path inside dest_dir, dropping unsafe components."""
+    arcname = os.path.splitdrive(filename.replace('\\', '/'))[1]
+    parts = [part for part in arcname.split('/') if part not in ('', '.', '..')]
+    if not parts:
+        return None
+    return os.path.join(dest_dir, *parts)
+
+
+def prune_thumbnail_cache(cache_dir: Path, limit: int) -> None:
+    """Delete the least recently used archive folders until the cache fits in limit bytes.
+
+    Each archive gets one folder, and opening it bumps the folder's mtime.
+    """
+    folders = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                size = 0
+                with os.scandir(entry.path) as files:
+                    for file in files:
+                        size += file.stat(follow_symlinks=False).st_size
+                folders.append((entry.stat(follow_symlinks=False).st_mtime, size, entry.path))
+                total += size
+    except OSError:
+        return
+
+    folders.sort()
+    for _mtime, size, path in folders:
+        if total <= limit:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
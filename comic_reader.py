@@ -1,16 +1,27 @@
-﻿import os
+﻿import hashlib
+import bisect
+import functools
+import mmap
+import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import zipfile
-from datetime import datetime
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import patoolib
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QAction, QCloseEvent, QPixmap
+from PySide6.QtCore import QBuffer, QByteArray, QObject, QRunnable, Qt, QThread, QThreadPool, QTimer, Signal
+from PySide6.QtGui import (
+    QAction, QCloseEvent, QImage, QImageIOHandler, QImageReader, QPaintEvent, QPixmap, QPixmapCache
+)
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -29,6 +40,165 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+import comic_files
+import zip_entries
+
+# Optional libdeflate bindings, used instead of zlib for pages that are deflated
+HAS_DEFLATE = False
+try:
+    import deflate  # libdeflate
+    HAS_DEFLATE = True
+except ImportError:
+    HAS_DEFLATE = False
+
+# Optional RAR reader, used ahead of patool for CBR extraction
+HAS_RARFILE = False
+try:
+    import rarfile
+    HAS_RARFILE = True
+except ImportError:
+    HAS_RARFILE = False
+
+# Optional libarchive bindings (libarchive-c), which read RAR in-process
+# rather than through an unrar subprocess; tried ahead of rarfile
+HAS_LIBARCHIVE = False
+try:
+    import libarchive
+    HAS_LIBARCHIVE = True
+except ImportError:
+    HAS_LIBARCHIVE = False
+
+# Lowercase, without the dot, as sliced off by is_image_name
+IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'bmp', 'webp'})
+
+# macOS adds ._<name> "AppleDouble" resource forks next to files it archives,
+# zipped under __MACOSX; they keep the image extension but aren't images
+MACOS_METADATA_DIR = '__MACOSX'
+APPLEDOUBLE_PREFIX = '._'
+
+# Formats that are already entropy-coded; DEFLATE saves next to nothing on them
+STORED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+# Thumbnail grid width, and rows built ahead of the bottom of the viewport
+PAGE_COLUMNS = 5
+PAGE_BUFFER_ROWS = 2
+# Milliseconds between page updates while scrolling, about one frame at 60 Hz
+SCROLL_UPDATE_INTERVAL = 16
+
+# Lowercase, with the dot; both are four characters so a name's tail can be sliced off
+COMIC_EXTENSIONS = frozenset({'.cbr', '.cbz'})
+
+# Chunk size for streaming pages and files around; far fewer syscalls than the 8-64 KiB defaults
+COPY_BUFFER_SIZE = 1 << 20
+
+# Scaled thumbnails are kept here between runs, one folder per archive version
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "cbreader"
+# Least recently opened archives' thumbnails are dropped beyond this many bytes
+THUMBNAIL_CACHE_LIMIT = 256 * 1024 * 1024
+
+# Backup file names: <stem>_backup_<YYYYmmdd_HHMMSS><suffix>
+BACKUP_NAME_PATTERN = re.compile(r'(.+)_backup_(\d{8}_\d{6})(\.[^.]*)?')
+
+
+def natural_sorted(paths: Iterable[str]) -> List[str]:
+    """Sort paths by file name in natural order.
+
+    Keys are built once per path and sorted as (key, path) tuples rather than
+    recomputed on every comparison.
+    """
+    keyed = [(comic_files.natural_key(os.path.basename(path)), path) for path in paths]
+    keyed.sort()
+    return [path for _key, path in keyed]
+
+
+def is_image_name(name: str) -> bool:
+    """Check a file name's extension without building a Path for it."""
+    _stem, dot, ext = name.rpartition('.')
+    return bool(dot) and ext.lower() in IMAGE_EXTENSIONS
+
+
+def is_page_name(name: str) -> bool:
+    """Check an archive member name is an image page rather than macOS metadata."""
+    parts = name.replace('\\', '/').split('/')
+    return (
+        not parts[-1].startswith(APPLEDOUBLE_PREFIX)
+        and MACOS_METADATA_DIR not in parts[:-1]
+        and is_image_name(parts[-1])
+    )
+
+
+def scan_image_files(directory: str) -> Iterator["os.DirEntry[str]"]:
+    """Yield the entries of image files under directory, recursing into subfolders."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != MACOS_METADATA_DIR:
+                    yield from scan_image_files(entry.path)
+            elif not entry.name.startswith(APPLEDOUBLE_PREFIX) and is_image_name(entry.name):
+                yield entry
+
+
+@functools.lru_cache(maxsize=64)
+def scan_comic_directory(directory: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """List the comic files in an absolute directory, sorted case-insensitively by name.
+
+    Returns the paths and a map from each path to its position. mtime_ns is
+    only part of the cache key: a changed directory misses and is rescanned,
+    and stale entries age out. The returned dict is shared, don't modify it.
+    """
+    # (lowercased name, path) pairs, so the sort compares plain tuples.
+    # Paths are built by joining names onto the directory rather than
+    # resolving every entry.
+    named_files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                lower_name = entry.name.lower()
+                # DirEntry.is_file uses the type from readdir, no extra stat
+                if lower_name[-4:] in COMIC_EXTENSIONS and entry.is_file():
+                    named_files.append((lower_name, os.path.join(directory, entry.name)))
+    except OSError:
+        return (), {}
+
+    named_files.sort()
+    comic_files = tuple(path for _name, path in named_files)
+    return comic_files, {path: index for index, path in enumerate(comic_files)}
+
+
+def remove_temp_dir(temp_dir: str) -> None:
+    """Delete an extraction directory, warning instead of raising on failure."""
+    try:
+        shutil.rmtree(temp_dir)
+    except Exception as e:
+        print(f"Warning: Could not clean up temp directory: {e}")
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy a file with its metadata like shutil.copy2, keeping the data in the kernel.
+
+    copy_file_range lets the filesystem clone or copy the blocks itself, even
+    across devices on recent kernels; shutil.copyfile (sendfile on Linux) is
+    the fallback wherever that is unavailable or refused.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as source, open(dst, 'wb') as target:
+                remaining = os.fstat(source.fileno()).st_size
+                while remaining > 0:
+                    count = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+                    if count == 0:
+                        # Some filesystems (FUSE, procfs-like) copy nothing; copyfile redoes it
+                        break
+                    remaining -= count
+            copied = remaining == 0
+        except OSError:
+            pass
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 class ImageExtractor(QThread):
     """Thread to extract images from comic book archives."""
 
@@ -40,80 +210,611 @@ class ImageExtractor(QThread):
         super().__init__()
         self.file_path = file_path
         self.temp_dir: Optional[str] = None
+        # Open when pages are read straight from a ZIP archive instead of
+        # disk; handed over to the window, which closes it
+        self.archive: Optional[zipfile.ZipFile] = None
 
     def run(self) -> None:
         try:
-            self.temp_dir = tempfile.mkdtemp()
-            self.progress_updated.emit(10, "Creating temporary directory...")
-
             # Determine file type and extract
             file_ext = Path(self.file_path).suffix.lower()
 
             if file_ext == '.cbz':
-                self.extract_zip()
+                # CBZ pages are decoded straight from the archive, so nothing
+                # needs to be written to disk
+                self.progress_updated.emit(30, "Reading CBZ file...")
+                self.archive = zipfile.ZipFile(self.file_path, 'r')
+                image_files = self.find_image_entries(self.archive)
             elif file_ext == '.cbr':
+                self.temp_dir = tempfile.mkdtemp()
+                self.progress_updated.emit(10, "Creating temporary directory...")
                 self.extract_rar()
+
+                # Find image files
+                self.progress_updated.emit(80, "Scanning for images...")
+                image_files = self.find_image_files()
             else:
                 self.error_occurred.emit(f"Unsupported file format: {file_ext}")
                 return
 
-            # Find image files
-            self.progress_updated.emit(80, "Scanning for images...")
-            image_files = self.find_image_files()
-
             self.progress_updated.emit(100, "Extraction complete!")
             self.extraction_finished.emit(image_files)
 
         except Exception as e:
+            if self.archive is not None:
+                self.archive.close()
+                self.archive = None
             self.error_occurred.emit(f"Error extracting archive: {str(e)}")
 
-    def extract_zip(self) -> None:
-        """Extract CBZ (ZIP) file."""
-        self.progress_updated.emit(30, "Extracting CBZ file...")
-        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-            zip_ref.extractall(self.temp_dir)
-
     def extract_rar(self) -> None:
-        """Extract CBR (RAR) file using patool, with fallback to ZIP for ZIP-based CBR files."""
+        """Extract CBR (RAR) file using rarfile or patool, with fallback to ZIP for ZIP-based CBR files."""
         self.progress_updated.emit(30, "Extracting CBR file...")
         try:
             # First try to extract as a RAR file
-            patoolib.extract_archive(self.file_path, outdir=self.temp_dir)
+            self.extract_rar_archive()
         except Exception as rar_error:
             # If RAR extraction fails, try ZIP extraction (for ZIP-based CBR files)
             self.progress_updated.emit(40, "Trying ZIP extraction for CBR file...")
             try:
-                with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-                    zip_ref.extractall(self.temp_dir)
+                self.extract_zip_parallel(40)
             except Exception as zip_error:
                 # If both fail, raise a combined error message
                 raise Exception(
                     f"Failed to extract CBR file. RAR error: {str(rar_error)}, ZIP error: {str(zip_error)}"
                 ) from rar_error
 
+    def extract_rar_archive(self) -> None:
+        """Extract a RAR archive into the temp directory.
+
+        libarchive decodes the archive in-process, with no unrar subprocess
+        at all. rarfile drives the unrar backend directly in a single call,
+        skipping patool's format probing and command building; patool is
+        still used when neither is installed or can handle the archive.
+        """
+        if HAS_LIBARCHIVE and self.temp_dir:
+            try:
+                self.extract_with_libarchive(self.temp_dir)
+                return
+            except libarchive.ArchiveError:
+                pass
+
+        if HAS_RARFILE:
+            try:
+                with rarfile.RarFile(self.file_path) as rar_ref:
+                    rar_ref.extractall(self.temp_dir)
+                return
+            except rarfile.Error:
+                pass
+
+        patoolib.extract_archive(self.file_path, outdir=self.temp_dir)
+
+    def extract_with_libarchive(self, dest_dir: str) -> None:
+        """Stream the archive's image entries into dest_dir with libarchive."""
+        directories: Set[str] = {dest_dir}
+        with libarchive.file_reader(self.file_path) as archive:
+            for entry in archive:
+                # Only pages are looked for afterwards, so nothing else is written
+                if not entry.isfile or not is_page_name(entry.pathname):
+                    continue
+                target = comic_files.member_target(dest_dir, entry.pathname)
+                if not target:
+                    continue
+                parent = os.path.dirname(target)
+                if parent not in directories:
+                    os.makedirs(parent, exist_ok=True)
+                    directories.add(parent)
+                with open(target, 'wb') as f:
+                    for block in entry.get_blocks():
+                        f.write(block)
+
+    def extract_zip_parallel(self, start_progress: int) -> None:
+        """Extract all ZIP entries into the temp directory across a thread pool."""
+        if not self.temp_dir:
+            return
+
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            members: List[Tuple[zipfile.ZipInfo, str]] = []
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+                target = comic_files.member_target(self.temp_dir, info.filename)
+                if target:
+                    members.append((info, target))
+        # Largest entries first, so a big spread started last doesn't leave
+        # one worker busy while the rest sit idle
+        members.sort(key=lambda member: member[0].compress_size, reverse=True)
+
+        # Create every directory exactly once, parents first, so workers only
+        # open files. os.makedirs per entry would re-stat the whole chain.
+        directories: Set[str] = set()
+        for _info, target in members:
+            parent = os.path.dirname(target)
+            while parent != self.temp_dir and parent not in directories:
+                directories.add(parent)
+                parent = os.path.dirname(parent)
+        for directory in sorted(directories, key=lambda d: d.count(os.sep)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                # Left behind by a partial RAR extraction before the ZIP fallback
+                pass
+
+        total = len(members)
+        done = 0
+        last_progress = start_progress
+        lock = threading.Lock()
+        # ZipFile handles are not safe to share between threads, so each
+        # worker opens its own the first time it runs
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+
+        def extract_member(member: Tuple[zipfile.ZipInfo, str]) -> None:
+            nonlocal done, last_progress
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                zip_ref = zipfile.ZipFile(self.file_path, 'r')
+                local.zip_ref = zip_ref
+                with lock:
+                    handles.append(zip_ref)
+
+            info, target = member
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 16)
+
+            with lock:
+                done += 1
+                # Only emit when the bar would move, so large archives don't
+                # flood the UI thread with queued signals
+                progress = start_progress + done * (80 - start_progress) // total
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_updated.emit(progress, f"Extracting page {done} of {total}...")
+
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for _ in executor.map(extract_member, members):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def find_image_entries(self, archive: zipfile.ZipFile) -> List[str]:
+        """Find all image entries in the CBZ archive."""
+        image_entries = [
+            info.filename for info in archive.infolist()
+            if not info.is_dir() and is_page_name(info.filename)
+        ]
+
+        # Sort entries naturally
+        return natural_sorted(image_entries)
+
     def find_image_files(self) -> List[str]:
         """Find all image files in the extracted directory."""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-        image_files: List[str] = []
+        if not self.temp_dir or not os.path.exists(self.temp_dir):
+            return []
 
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            for root, _dirs, files in os.walk(self.temp_dir):
-                for file in files:
-                    if Path(file).suffix.lower() in image_extensions:
-                        image_files.append(os.path.join(root, file))
+        # Sort files naturally, keyed on the names the scan already has
+        keyed = [(comic_files.natural_key(entry.name), entry.path) for entry in scan_image_files(self.temp_dir)]
+        keyed.sort()
+        return [path for _key, path in keyed]
+
+
+class ArchiveSaver(QThread):
+    """Thread to write the selected pages to a new archive, and back up the original first."""
+
+    progress_updated = Signal(int, str)
+    save_finished = Signal(str)
+    error_occurred = Signal(str)
+
+    def __init__(self, selected_pages: List[Tuple[str, str]], output_path: str,
+                 archive: Optional[zipfile.ZipFile], temp_dir: Optional[str], use_rar: bool = False,
+                 backup: Optional[Tuple[str, Path]] = None) -> None:
+        super().__init__()
+        self.selected_pages = selected_pages
+        self.output_path = output_path
+        # The window's open CBZ, if the pages are in one; the window leaves it
+        # alone until the save is finished
+        self.archive = archive
+        self.temp_dir = temp_dir
+        self.use_rar = use_rar
+        # (original, backup path) to back up before writing
+        self.backup = backup
+        self.pages_written = 0
+        self.last_percent = -1
+
+    def run(self) -> None:
+        try:
+            if self.backup is not None:
+                self.progress_updated.emit(0, "Creating backup...")
+                original_path, backup_path = self.backup
+                # A hard link costs no I/O: the original is swapped out with
+                # os.replace afterwards, so the link keeps the old contents alive
+                try:
+                    os.link(original_path, backup_path)
+                except OSError:
+                    # Different filesystem, no hard link support, or an existing backup
+                    copy_file(original_path, backup_path)
+
+            format_name = "CBR" if self.output_path.lower().endswith('.cbr') else "CBZ"
+            if self.use_rar:
+                # For CBR files, try to create a true RAR archive first
+                self.progress_updated.emit(0, "Creating RAR archive...")
+                # rar refuses to add to an existing file that isn't an archive
+                if os.path.exists(self.output_path):
+                    os.unlink(self.output_path)
+                if self.create_rar_archive(self.selected_pages, self.output_path):
+                    self.progress_updated.emit(100, "RAR archive created.")
+                    self.save_finished.emit("RAR-based CBR")
+                    return
+                # If RAR creation fails, fall back to ZIP-based CBR
+                self.progress_updated.emit(0, "RAR failed, creating ZIP-based CBR...")
+
+            with zipfile.ZipFile(self.output_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                self.write_pages_to_zip(zip_file, self.selected_pages)
+            self.save_finished.emit(f"ZIP-based {format_name}")
+
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def write_pages_to_zip(self, zip_file: zipfile.ZipFile, selected_pages: List[Tuple[str, str]]) -> None:
+        """Write the selected pages to zip_file as page_NNN entries, in order.
+
+        Pages from the open CBZ are copied still compressed, so they are
+        neither inflated nor compressed again. Other pages that need DEFLATE
+        are compressed on a thread pool (zlib releases the GIL) while earlier
+        pages are written. ZipFile is not thread-safe, so every entry is
+        written from this thread.
+        """
+        max_workers = os.cpu_count() or 1
+        pending: Deque[Tuple[str, str, Optional[Future]]] = deque()
+        archive = self.archive
+        source: Optional[BinaryIO] = None
+        if archive is not None and archive.filename:
+            source = open(archive.filename, 'rb')
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file_path, new_name in selected_pages:
+                    future: Optional[Future] = None
+                    info = archive.getinfo(file_path) if archive is not None else None
+                    if source is not None and info is not None and not info.flag_bits & 0x1:
+                        # Already compressed as it should be; queued like a finished deflate
+                        future = Future()
+                        future.set_result(self.copy_raw_page(source, info, new_name))
+                    elif os.path.splitext(new_name)[1].lower() not in STORED_EXTENSIONS:
+                        future = executor.submit(self.deflate_page, new_name, self.read_page(file_path))
+                    pending.append((file_path, new_name, future))
+
+                    # Bound the number of compressed pages held in memory
+                    if len(pending) > max_workers * 2:
+                        self.write_pending_page(zip_file, *pending.popleft())
+
+                while pending:
+                    self.write_pending_page(zip_file, *pending.popleft())
+        finally:
+            if source is not None:
+                source.close()
+
+    def write_pending_page(self, zip_file: zipfile.ZipFile, file_path: str, new_name: str,
+                           future: Optional[Future]) -> None:
+        """Write one page queued by write_pages_to_zip."""
+        self.pages_written += 1
+        percent = self.pages_written * 100 // len(self.selected_pages)
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.progress_updated.emit(percent, f"Writing page {self.pages_written} of {len(self.selected_pages)}...")
+
+        if future is None:
+            self.add_page_to_zip(zip_file, file_path, new_name)
+            return
+
+        # zipfile can't take pre-compressed data, so write the local header and
+        # payload directly and register the entry for the central directory
+        zinfo, payload = future.result()
+        zip_entries.write_entry(zip_file, zinfo, (payload,))
+
+    @staticmethod
+    def deflate_page(new_name: str, data: bytes) -> Tuple[zipfile.ZipInfo, bytes]:
+        """DEFLATE one page, returning its ZipInfo and compressed payload."""
+        zinfo = zipfile.ZipInfo(new_name, time.localtime()[:6])
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+
+        if HAS_DEFLATE:
+            payload = deflate.deflate_compress(data, 6)
+        else:
+            # Raw DEFLATE stream (negative wbits) as stored in ZIP entries
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            payload = compressor.compress(data) + compressor.flush()
+
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(payload)
+        zinfo.CRC = zlib.crc32(data)
+        return zinfo, payload
+
+    @staticmethod
+    def copy_raw_page(source: BinaryIO, info: zipfile.ZipInfo, new_name: str) -> Tuple[zipfile.ZipInfo, bytes]:
+        """Read an entry's compressed payload from source, returning a ZipInfo for it under new_name."""
+        zip_entries.seek_payload(source, info)
+        payload = source.read(info.compress_size)
+
+        zinfo = zipfile.ZipInfo(new_name, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.external_attr = 0o600 << 16
+        zinfo.file_size = info.file_size
+        zinfo.compress_size = info.compress_size
+        zinfo.CRC = info.CRC
+        return zinfo, payload
+
+    def read_page(self, file_path: str) -> bytes:
+        """Read a page's bytes from the open archive or from disk."""
+        if self.archive is not None:
+            return self.archive.read(file_path)
+        with open(file_path, 'rb') as f:
+            return f.read()
+
+    def add_page_to_zip(self, zip_file: zipfile.ZipFile, file_path: str, new_name: str) -> None:
+        """Add a page to zip_file, reading it from the open archive when there is one."""
+        if os.path.splitext(new_name)[1].lower() in STORED_EXTENSIONS:
+            compress_type = zipfile.ZIP_STORED
+        else:
+            compress_type = zipfile.ZIP_DEFLATED
+
+        # Stream the page across in large chunks rather than ZipFile.write's 8 KiB
+        # ones; the entry's size is set up front so zipfile picks ZIP64 correctly
+        if self.archive is not None:
+            zinfo = zipfile.ZipInfo(new_name, time.localtime()[:6])
+            zinfo.external_attr = 0o600 << 16
+            zinfo.file_size = self.archive.getinfo(file_path).file_size
+            source: IO[bytes] = self.archive.open(file_path)
+        else:
+            zinfo = zipfile.ZipInfo.from_file(file_path, new_name)
+            source = open(file_path, 'rb')
+        # No compresslevel: the zlib default is level 6
+        zinfo.compress_type = compress_type
+
+        with source, zip_file.open(zinfo, 'w') as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+
+    def create_rar_archive(self, selected_pages: List[Tuple[str, str]], output_path: str) -> bool:
+        """Create a RAR archive using command-line RAR tool. Returns True if successful."""
+        try:
+            # Create a temporary directory to organize files with proper names,
+            # next to the extracted pages so they can be hard-linked into it
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as temp_dir:
+                temp_path = Path(temp_dir)
+
+                # Link files in with proper page names
+                for file_path, new_name in selected_pages:
+                    temp_file = temp_path / new_name
+                    try:
+                        os.link(file_path, temp_file)
+                    except OSError:
+                        # copyfile moves the bytes in-kernel where it can and skips
+                        # copy2's metadata calls, which rar doesn't need
+                        shutil.copyfile(file_path, temp_file)
+
+                # Try to create RAR archive
+                rar_commands = ['rar', 'winrar']
+                for rar_cmd in rar_commands:
+                    try:
+                        # RAR command: a = add, -r = recurse subdirectories, -ep1 = exclude base folder from paths
+                        cmd = [rar_cmd, 'a', '-r', '-ep1', str(output_path), str(temp_path / '*')]
+                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+                        if result.returncode == 0:
+                            return True
+                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                        continue
+
+                return False
+
+        except Exception:
+            return False
+
+
+class ThumbnailSignals(QObject):
+    """Signals for ThumbnailTask, which as a QRunnable cannot define its own."""
+
+    thumbnail_ready = Signal(int, int, QImage)
+
+
+class ZipHandlePool:
+    """ZipFile handles on one archive, reused across thumbnail tasks.
+
+    Stored and deflated entries are sliced straight out of a read-only memory
+    map of the archive, using the central directory already parsed by the
+    window's ZipFile, so reading a page is a copy out of the page cache and
+    any number of threads can do it at once. Other entries go through
+    ZipFile, which is not safe to share between threads, so each such read
+    borrows a handle of its own. Handles are opened on demand, at most one
+    per task running at once, instead of one per page.
+    """
+
+    def __init__(self, path: str, entries: Dict[str, zipfile.ZipInfo]) -> None:
+        self.path = path
+        self.entries = entries
+        self.lock = threading.Lock()
+        self.free: List[zipfile.ZipFile] = []
+        self.closed = False
+        self.mapping: Optional[mmap.mmap] = None
+        try:
+            with open(path, 'rb') as f:
+                self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Not mappable (or empty); every read goes through ZipFile
+            pass
+
+    def read(self, name: str) -> bytes:
+        """Read one entry from the memory map, or using a free handle, opening a new one if none is free."""
+        info = self.entries.get(name)
+        mapping = self.mapping
+        if (mapping is not None and info is not None and not info.flag_bits & 0x1
+                and info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)):
+            return self.read_mapped(mapping, info)
+
+        with self.lock:
+            zip_ref = self.free.pop() if self.free else None
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(self.path, 'r')
+
+        try:
+            return zip_ref.read(name)
+        finally:
+            with self.lock:
+                if self.closed:
+                    zip_ref.close()
+                else:
+                    self.free.append(zip_ref)
+
+    @staticmethod
+    def read_mapped(mapping: mmap.mmap, info: zipfile.ZipInfo) -> bytes:
+        """Slice an entry's payload out of the mapped archive and inflate it if needed."""
+        offset = info.header_offset
+        start = offset + zip_entries.local_header_size(mapping[offset:offset + zip_entries.LOCAL_HEADER_SIZE])
+        data = mapping[start:start + info.compress_size]
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            # Raw DEFLATE stream (negative wbits) as stored in ZIP entries
+            data = zlib.decompress(data, -15)
+
+        # Checked like ZipFile does, so a damaged page fails to load rather than half-decoding
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+        return data
+
+    def close(self) -> None:
+        """Close the free handles and the memory map; handles still in use are closed when returned."""
+        with self.lock:
+            self.closed = True
+            for zip_ref in self.free:
+                zip_ref.close()
+            self.free.clear()
+            if self.mapping is not None:
+                self.mapping.close()
+                self.mapping = None
+
+
+class ThumbnailTask(QRunnable):
+    """Decode and scale one page thumbnail on a thread pool worker."""
+
+    def __init__(
+        self,
+        signals: ThumbnailSignals,
+        generation: int,
+        index: int,
+        image_path: str,
+        zip_handles: Optional[ZipHandlePool],
+        cache_file: Optional[str],
+    ) -> None:
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.index = index
+        # image_path names an entry in the zip_handles archive when one is given
+        self.image_path = image_path
+        self.zip_handles = zip_handles
+        self.cache_file = cache_file
+
+    def run(self) -> None:
+        image = QImage()
+        if self.cache_file and os.path.exists(self.cache_file):
+            image.load(self.cache_file)
+
+        if image.isNull():
+            image = self.decode_thumbnail()
+            if self.cache_file and not image.isNull():
+                try:
+                    os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                    # Written as JPEG, going by the .jpg suffix
+                    image.save(self.cache_file, quality=80)
+                except OSError:
+                    pass
+
+        self.signals.thumbnail_ready.emit(self.generation, self.index, image)
+
+    def decode_thumbnail(self) -> QImage:
+        """Load the page at thumbnail size.
+
+        The reader is asked for the scaled size up front, so decoders that
+        support it (JPEG) downscale while decoding and the full-resolution
+        image is never built.
+        """
+        try:
+            if self.zip_handles is not None:
+                buffer = QBuffer()
+                buffer.setData(QByteArray(self.zip_handles.read(self.image_path)))
+                reader = QImageReader(buffer)
+            else:
+                reader = QImageReader(self.image_path)
+            reader.setAutoTransform(True)
+
+            # Scale to fit while maintaining aspect ratio. Formats that can't
+            # scale while decoding would only be smooth-scaled from full size
+            # by the reader, so those are left to fit_thumbnail.
+            scaled_in_decoder = reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize)
+            size = reader.size()
+            if size.isValid() and scaled_in_decoder:
+                size.scale(140, 180, Qt.AspectRatioMode.KeepAspectRatio)
+                reader.setScaledSize(size)
+            image = reader.read()
+        except Exception:
+            return QImage()
+
+        if image.isNull() or (size.isValid() and scaled_in_decoder):
+            return image
+        return self.fit_thumbnail(image)
+
+    @staticmethod
+    def fit_thumbnail(image: QImage) -> QImage:
+        """Scale a full-size page down to thumbnail size.
+
+        Pages many times larger than the thumbnail are first cut to twice its
+        size with a fast nearest-neighbour pass, so smooth filtering only runs
+        over the last, small step.
+        """
+        if image.width() > 4 * 140 or image.height() > 4 * 180:
+            image = image.scaled(280, 360, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+        return image.scaled(140, 180, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+class PrefetchTask(QRunnable):
+    """Pull an archive into the OS page cache so opening it later skips the disk."""
+
+    def __init__(self, file_path: str) -> None:
+        super().__init__()
+        self.file_path = file_path
+
+    def run(self) -> None:
+        try:
+            with open(self.file_path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    # The kernel reads ahead asynchronously, nothing is copied here
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(COPY_BUFFER_SIZE):
+                        pass
+        except OSError:
+            pass
 
-        # Sort files naturally
-        image_files.sort(key=lambda x: Path(x).name.lower())
-        return image_files
 
 class PageWidget(QFrame):
     """Widget to display a single comic page with selection checkbox."""
 
-    def __init__(self, image_path: str, page_number: int) -> None:
+    # Emitted with the page index when the thumbnail has to be decoded
+    thumbnail_needed = Signal(int)
+
+    def __init__(self, image_path: str, page_number: int, thumbnail_key: str, page_selection: bytearray) -> None:
         super().__init__()
         self.image_path = image_path
         self.page_number = page_number
         self.selected = True
+        # The window's per-page selection flags, kept in step with the checkbox
+        self.page_selection = page_selection
+        # The scaled pixmap lives in QPixmapCache under thumbnail_key; the label
+        # only holds it while the page is on screen
+        self.thumbnail_key = thumbnail_key
+        self.thumbnail_requested = False
+        self.thumbnail_shown = False
+        self.thumbnail_released = False
 
         self.setFrameStyle(QFrame.Shape.Box)
         self.setMinimumSize(150, 200)
@@ -130,27 +831,61 @@ class PageWidget(QFrame):
         # Image label
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setScaledContents(True)
-        self.image_label.setMinimumSize(140, 180)
+        # Thumbnails arrive pre-scaled to fit 140x180, so paint them 1:1 rather
+        # than letting the label resample them on every paint
+        self.image_label.setScaledContents(False)
+        self.image_label.setFixedSize(140, 180)
 
-        # Load and display thumbnail
-        self.load_thumbnail()
+        # Grey placeholder until the page is scrolled into view and decoded
+        self.image_label.setStyleSheet("background-color: #e0e0e0;")
 
         layout.addWidget(self.image_label)
         self.setLayout(layout)
 
-    def load_thumbnail(self) -> None:
-        """Load and display a thumbnail of the image."""
-        try:
-            pixmap = QPixmap(self.image_path)
-            if not pixmap.isNull():
-                # Scale to fit while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(140, 180, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.image_label.setPixmap(scaled_pixmap)
-            else:
-                self.image_label.setText("Failed to load image")
-        except Exception as e:
-            self.image_label.setText(f"Error: {str(e)}")
+    def set_thumbnail(self, image: QImage) -> None:
+        """Display a thumbnail decoded by a ThumbnailTask."""
+        self.image_label.setStyleSheet("")
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self.thumbnail_key, pixmap)
+            self.image_label.setPixmap(pixmap)
+            self.thumbnail_shown = True
+        else:
+            self.image_label.setText("Failed to load image")
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Load the thumbnail the first time the page is actually painted."""
+        # Qt only paints pages inside the scroll area's viewport
+        self.ensure_loaded()
+        super().paintEvent(event)
+
+    def ensure_loaded(self) -> None:
+        """Ask for the thumbnail to be decoded, or restore it if it was released."""
+        if not self.thumbnail_requested:
+            self.thumbnail_requested = True
+            self.image_label.setText("Loading...")
+            self.thumbnail_needed.emit(self.page_number - 1)
+        elif self.thumbnail_released and not self.restore_thumbnail():
+            # Evicted while off screen; decode it again, usually from the disk cache
+            self.thumbnail_needed.emit(self.page_number - 1)
+
+    def release_thumbnail(self) -> None:
+        """Drop the displayed pixmap, leaving QPixmapCache free to evict it."""
+        if self.thumbnail_shown:
+            self.image_label.clear()
+            self.thumbnail_shown = False
+            self.thumbnail_released = True
+
+    def restore_thumbnail(self) -> bool:
+        """Show the cached pixmap again. Returns False if it has been evicted."""
+        self.thumbnail_released = False
+        pixmap = QPixmap()
+        if not QPixmapCache.find(self.thumbnail_key, pixmap):
+            self.image_label.setText("Loading...")
+            return False
+        self.image_label.setPixmap(pixmap)
+        self.thumbnail_shown = True
+        return True
 
     def on_selection_changed(self, state: int) -> None:
         """Handle checkbox state change."""
@@ -160,6 +895,7 @@ class PageWidget(QFrame):
             self.setStyleSheet("PageWidget { background-color: white; }")
         else:
             self.setStyleSheet("PageWidget { background-color: #ffcccc; }")
+        self.page_selection[self.page_number - 1] = self.selected
 
     def is_selected(self) -> bool:
         """Return whether this page is selected."""
@@ -170,13 +906,79 @@ class ComicBookReader(QMainWindow):
 
     def __init__(self) -> None:
         super().__init__()
-        self.current_file: Optional[str] = None
+        # Parts of the current file's path, kept up to date by the current_file setter
+        self._current_file: Optional[str] = None
+        self.current_file_abs = ""
+        self.current_directory = ""
+        self.current_stem = ""
+        self.current_suffix = ""
         self.temp_dir: Optional[str] = None
+        # Open CBZ that image_files are read from, None when they are extracted to disk
+        self.archive: Optional[zipfile.ZipFile] = None
+        # Handles on the same archive for the thumbnail thread pool
+        self.zip_handles: Optional[ZipHandlePool] = None
         self.image_files: List[str] = []
+        # Widgets for the first len(page_widgets) pages; the rest are built
+        # as they are scrolled towards
         self.page_widgets: List[PageWidget] = []
+        # One byte per page, 1 if it is selected, so counting and saving don't
+        # touch the widgets (most of which may not be built yet). Page widgets
+        # write to it, so it is only ever updated in place.
+        self.page_selection = bytearray()
+        # Kept for naming the pages when they are saved
+        self.page_extensions: List[str] = []
+        self.page_row_height = 0
+        self.rar_available: Optional[bool] = None
+        # Running save, during which the window is locked
+        self.saver: Optional[ArchiveSaver] = None
+        # Menu actions that open or save files, locked along with the window
+        self.file_actions: List[QAction] = []
+        # Backups go to a folder in the directory the reader was started from
+        self.backup_dir = Path.cwd() / "backups"
+        # Backup names per (stem, suffix) of the original, oldest first. The
+        # folder is read in one pass and only re-read when its mtime changes.
+        self.backup_index: Dict[Tuple[str, str], List[str]] = {}
+        self.backup_index_mtime: Optional[int] = None
+        self.refresh_backup_index()
+
+        # Last state applied to the revert and (previous, next) buttons, so
+        # unchanged updates don't touch the widgets
+        self.revert_state = False
+        self.navigation_state = (False, False)
+
+        # Thumbnails from a previous load_pages call are ignored by generation
+        self.thumbnail_generation = 0
+        self.thumbnail_signals = ThumbnailSignals(self)
+        # A pool of its own, so clearing stale thumbnails leaves other
+        # background work (prefetching) on the global pool alone
+        self.thumbnail_pool = QThreadPool(self)
+        self.thumbnail_signals.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.thumbnail_cache_dir: Optional[str] = None
+
+        # Bound the memory held by page thumbnails (limit is in KB)
+        QPixmapCache.setCacheLimit(64 * 1024)
+        # Keep the on-disk thumbnail cache bounded too, without delaying startup
+        threading.Thread(
+            target=comic_files.prune_thumbnail_cache, args=(THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_LIMIT), daemon=True
+        ).start()
 
         self.init_ui()
 
+    @property
+    def current_file(self) -> Optional[str]:
+        """Path of the open archive."""
+        return self._current_file
+
+    @current_file.setter
+    def current_file(self, file_path: Optional[str]) -> None:
+        self._current_file = file_path
+        if file_path is None:
+            self.current_file_abs = self.current_directory = self.current_stem = self.current_suffix = ""
+            return
+        self.current_file_abs = os.path.abspath(file_path)
+        self.current_directory, name = os.path.split(self.current_file_abs)
+        self.current_stem, self.current_suffix = os.path.splitext(name)
+
     def init_ui(self) -> None:
         """Initialize the user interface."""
         self.setWindowTitle("Comic Book Reader - CBR/CBZ Editor")
@@ -186,10 +988,10 @@ class ComicBookReader(QMainWindow):
         self.create_menu_bar()
 
         # Create main widget and layout
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
+        self.main_widget = QWidget()
+        self.setCentralWidget(self.main_widget)
 
-        main_layout = QVBoxLayout(main_widget)
+        main_layout = QVBoxLayout(self.main_widget)
 
         # Create toolbar
         toolbar_layout = QHBoxLayout()
@@ -255,10 +1057,22 @@ class ComicBookReader(QMainWindow):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        # Container widget for pages
+        # Scroll bar moves are handled at most once a frame rather than once a pixel
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(SCROLL_UPDATE_INTERVAL)
+        self.scroll_timer.timeout.connect(self.on_scroll_settled)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_scroll_update)
+        # Resizing the window can bring more rows into view without scrolling
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(self.build_visible_pages)
+
+        # Container widget for pages. Rows are packed at the top, the stretch
+        # below takes up the room reserved for pages not built yet.
         self.pages_container = QWidget()
-        self.pages_layout = QGridLayout(self.pages_container)
+        pages_container_layout = QVBoxLayout(self.pages_container)
+        self.pages_layout = QGridLayout()
+        pages_container_layout.addLayout(self.pages_layout)
+        pages_container_layout.addStretch()
         self.scroll_area.setWidget(self.pages_container)
 
         main_layout.addWidget(self.scroll_area)
@@ -303,6 +1117,8 @@ class ComicBookReader(QMainWindow):
         save_as_action.triggered.connect(self.save_as_modified_archive)
         file_menu.addAction(save_as_action)
 
+        self.file_actions = [open_action, prev_action, next_action, save_action, save_as_action]
+
         file_menu.addSeparator()
 
         exit_action = QAction('Exit', self)
@@ -341,6 +1157,7 @@ class ComicBookReader(QMainWindow):
 
         # Clean up previous temp directory
         self.cleanup_temp_dir()
+        self.close_archive()
 
         # Create and start extraction thread
         self.extractor = ImageExtractor(file_path)
@@ -359,6 +1176,10 @@ class ComicBookReader(QMainWindow):
         self.progress_bar.setVisible(False)
         self.image_files = image_files
         self.temp_dir = self.extractor.temp_dir
+        if self.extractor.archive is not None:
+            # Reuse the extractor's handle rather than parsing the central directory again
+            self.archive = self.extractor.archive
+            self.zip_handles = ZipHandlePool(self.extractor.file_path, self.archive.NameToInfo)
 
         # Reset navigation button text
         self.prev_button.setText("◀ Previous")
@@ -408,23 +1229,128 @@ class ComicBookReader(QMainWindow):
             widget.deleteLater()
         self.page_widgets.clear()
 
-        # Create page widgets
-        columns = 5  # Number of columns in grid
-        for i, image_path in enumerate(self.image_files):
-            page_widget = PageWidget(image_path, i + 1)
-            self.page_widgets.append(page_widget)
+        # Drop any thumbnails still queued for the last file
+        self.thumbnail_pool.clear()
+        self.thumbnail_generation += 1
+        self.thumbnail_cache_dir = self.get_thumbnail_cache_dir()
+
+        self.page_selection = bytearray(b'\x01') * len(self.image_files)
+        self.page_extensions = [os.path.splitext(path)[1] for path in self.image_files]
+        self.page_row_height = 0
+        self.pages_container.setMinimumHeight(0)
+
+        # Only the rows in view are built now; each page queues its thumbnail
+        # when first painted
+        self.build_visible_pages()
+
+    def build_visible_pages(self) -> None:
+        """Build page widgets down to a couple of rows past the bottom of the viewport."""
+        if len(self.page_widgets) >= len(self.image_files):
+            return
+
+        if not self.page_widgets:
+            # Build the first row to measure it, then reserve room for every
+            # row so the scroll bar spans the whole archive
+            self.build_pages(PAGE_COLUMNS)
+            self.page_row_height = self.page_widgets[0].sizeHint().height() + max(self.pages_layout.verticalSpacing(), 0)
+            rows = (len(self.image_files) + PAGE_COLUMNS - 1) // PAGE_COLUMNS
+            self.pages_container.setMinimumHeight(rows * self.page_row_height)
+
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        bottom = scroll_bar.value() + self.scroll_area.viewport().height()
+        rows = bottom // self.page_row_height + 1 + PAGE_BUFFER_ROWS
+        self.build_pages(rows * PAGE_COLUMNS)
+
+    def build_pages(self, count: int) -> None:
+        """Build widgets for the pages up to count, continuing from the last one built."""
+        start = len(self.page_widgets)
+        end = min(count, len(self.image_files))
+        if start >= end:
+            return
+
+        # Add the whole batch before the container repaints, rather than
+        # painting it part-built after each widget
+        self.pages_container.setUpdatesEnabled(False)
+        try:
+            for i in range(start, end):
+                page_widget = PageWidget(
+                    self.image_files[i], i + 1, f"thumb:{self.thumbnail_generation}:{i}", self.page_selection
+                )
+                if not self.page_selection[i]:
+                    page_widget.checkbox.setChecked(False)
+                page_widget.thumbnail_needed.connect(self.request_thumbnail)
+                self.page_widgets.append(page_widget)
+                self.pages_layout.addWidget(page_widget, i // PAGE_COLUMNS, i % PAGE_COLUMNS)
+        finally:
+            self.pages_container.setUpdatesEnabled(True)
+
+    def request_thumbnail(self, index: int) -> None:
+        """Queue a page's thumbnail to be decoded on the thread pool."""
+        image_path = self.image_files[index]
+
+        cache_file = None
+        if self.thumbnail_cache_dir:
+            # Key on the page's name inside the archive, the temp dir changes every load
+            if self.zip_handles is not None:
+                page_name = image_path
+            else:
+                # With / separators, so the Tk reader computes the same key
+                page_name = os.path.relpath(image_path, self.temp_dir or "").replace(os.sep, '/')
+            cache_file = os.path.join(self.thumbnail_cache_dir, f"{hashlib.sha1(page_name.encode()).hexdigest()}.jpg")
+
+        self.thumbnail_pool.start(ThumbnailTask(
+            self.thumbnail_signals, self.thumbnail_generation, index, image_path, self.zip_handles, cache_file
+        ))
+
+    def schedule_scroll_update(self) -> None:
+        """Queue on_scroll_settled, unless it is already due; a running timer isn't restarted."""
+        if not self.scroll_timer.isActive():
+            self.scroll_timer.start()
+
+    def on_scroll_settled(self) -> None:
+        """Build newly reachable pages and release the ones scrolled away from."""
+        self.release_hidden_thumbnails()
+        self.build_visible_pages()
+
+    def release_hidden_thumbnails(self) -> None:
+        """Release the thumbnails of pages scrolled out of view."""
+        for widget in self.page_widgets:
+            if widget.visibleRegion().isEmpty():
+                widget.release_thumbnail()
+
+    def on_thumbnail_ready(self, generation: int, index: int, image: QImage) -> None:
+        """Hand a decoded thumbnail to its page widget."""
+        if generation == self.thumbnail_generation and index < len(self.page_widgets):
+            self.page_widgets[index].set_thumbnail(image)
+
+    def get_thumbnail_cache_dir(self) -> Optional[str]:
+        """Get the thumbnail cache folder for the current file, keyed by path, mtime and size."""
+        if not self.current_file:
+            return None
+
+        try:
+            stat = os.stat(self.current_file)
+        except OSError:
+            return None
 
-            row = i // columns
-            col = i % columns
-            self.pages_layout.addWidget(page_widget, row, col)
+        key = f"{self.current_file_abs}|{stat.st_mtime}|{stat.st_size}"
+        cache_dir = str(THUMBNAIL_CACHE_DIR / hashlib.sha1(key.encode()).hexdigest())
+        try:
+            # Mark as recently used for comic_files.prune_thumbnail_cache
+            os.utime(cache_dir)
+        except OSError:
+            pass
+        return cache_dir
 
     def select_all_pages(self) -> None:
         """Select all pages."""
+        self.page_selection[:] = b'\x01' * len(self.page_selection)
         for widget in self.page_widgets:
             widget.checkbox.setChecked(True)
 
     def select_no_pages(self) -> None:
         """Deselect all pages."""
+        self.page_selection[:] = bytes(len(self.page_selection))
         for widget in self.page_widgets:
             widget.checkbox.setChecked(False)
 
@@ -434,10 +1360,10 @@ class ComicBookReader(QMainWindow):
             return
 
         total_pages = len(self.image_files)
-        selected_pages = sum(1 for widget in self.page_widgets if widget.is_selected())
+        selected_pages = self.page_selection.count(1)
 
         # Determine file format and archive capabilities
-        original_ext = Path(self.current_file).suffix.lower()
+        original_ext = self.current_suffix.lower()
         format_name = "CBR" if original_ext == '.cbr' else "CBZ"
 
         if original_ext == '.cbr':
@@ -449,7 +1375,7 @@ class ComicBookReader(QMainWindow):
             format_detail = f"{format_name} (ZIP-based)"
 
         info_text = f"""
-Current File: {os.path.basename(self.current_file)}
+Current File: {self.current_stem}{self.current_suffix}
 Format: {format_detail}
 Total Pages: {total_pages}
 Selected Pages: {selected_pages}
@@ -462,18 +1388,24 @@ Instructions:
 """
         self.info_text.setText(info_text)
 
+    def get_selected_pages(self) -> List[Tuple[str, str]]:
+        """Return (image path, archive name) for each selected page, numbered in order."""
+        selected = [index for index, flag in enumerate(self.page_selection) if flag]
+        # Create a proper filename with page number
+        return [
+            (self.image_files[index], f"page_{i+1:03d}{self.page_extensions[index]}")
+            for i, index in enumerate(selected)
+        ]
+
     def save_modified_archive(self) -> None:
         """Save a new archive in place of the current file with backup."""
         if not self.page_widgets:
             QMessageBox.warning(self, "Warning", "No pages loaded.")
             return
 
-        selected_files = []
-        for i, widget in enumerate(self.page_widgets):
-            if widget.is_selected():
-                selected_files.append(self.image_files[i])
+        selected_pages = self.get_selected_pages()
 
-        if not selected_files:
+        if not selected_pages:
             QMessageBox.warning(self, "Warning", "No pages selected. Please select at least one page.")
             return
 
@@ -482,8 +1414,8 @@ Instructions:
 
         # Ask for confirmation
         total_pages = len(self.image_files)
-        removed_count = total_pages - len(selected_files)
-        original_ext = Path(self.current_file).suffix.lower()
+        removed_count = total_pages - len(selected_pages)
+        original_ext = self.current_suffix.lower()
         format_name = "CBR" if original_ext == '.cbr' else "CBZ"
 
         # Determine what type of archive will be created
@@ -498,7 +1430,7 @@ Instructions:
         reply = QMessageBox.question(
             self,
             "Save In Place",
-            f"This will replace the original file with {len(selected_files)} pages "
+            f"This will replace the original file with {len(selected_pages)} pages "
             f"(removing {removed_count} pages).\n\n"
             f"{archive_info}\n"
             f"A backup will be created in the 'backups' folder.\n\n"
@@ -508,7 +1440,7 @@ Instructions:
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.create_new_archive_in_place(selected_files, self.current_file)
+            self.create_new_archive_in_place(selected_pages, self.current_file)
 
     def save_as_modified_archive(self) -> None:
         """Save a new archive with only selected pages to a new location."""
@@ -516,19 +1448,16 @@ Instructions:
             QMessageBox.warning(self, "Warning", "No pages loaded.")
             return
 
-        selected_files = []
-        for i, widget in enumerate(self.page_widgets):
-            if widget.is_selected():
-                selected_files.append(self.image_files[i])
+        selected_pages = self.get_selected_pages()
 
-        if not selected_files:
+        if not selected_pages:
             QMessageBox.warning(self, "Warning", "No pages selected. Please select at least one page.")
             return
 
         if not self.current_file:
             return
 
-        original_name = Path(self.current_file).stem
+        original_name = self.current_stem
         default_name = f"{original_name}_modified.cbz"
 
         save_path, _ = QFileDialog.getSaveFileName(
@@ -539,88 +1468,84 @@ Instructions:
         )
 
         if save_path:
-            self.create_new_archive(selected_files, save_path)
+            if self.archive is not None and os.path.abspath(save_path) == self.current_file_abs:
+                # Pages are still being read from this file, so it can't be rewritten here
+                QMessageBox.warning(self, "Warning", "Use 'Save In Place' to overwrite the open file.")
+                return
+            self.create_new_archive(selected_pages, save_path)
 
-    def create_new_archive(self, selected_files: List[str], save_path: str) -> None:
+    def create_new_archive(self, selected_pages: List[Tuple[str, str]], save_path: str) -> None:
         """Create a new CBZ archive with selected pages."""
-        try:
-            self.status_label.setText("Creating new archive...")
+        self.status_label.setText("Creating new archive...")
+        saver = ArchiveSaver(selected_pages, save_path, self.archive, self.temp_dir)
+        saver.save_finished.connect(functools.partial(self.on_save_as_finished, save_path))
+        saver.error_occurred.connect(self.on_save_error)
+        self.start_saving(saver)
+
+    def on_save_as_finished(self, save_path: str, archive_type: str) -> None:
+        """Report a finished Save As."""
+        selected_count = self.finish_saving()
+
+        removed_count = len(self.image_files) - selected_count
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Archive saved successfully!\n"
+            f"Saved {selected_count} pages.\n"
+            f"Removed {removed_count} pages.\n"
+            f"File: {save_path}"
+        )
 
-            with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for i, file_path in enumerate(selected_files):
-                    # Create a proper filename with page number
-                    extension = Path(file_path).suffix
-                    new_name = f"page_{i+1:03d}{extension}"
+        self.status_label.setText(f"Archive saved: {os.path.basename(save_path)}")
+        self.forget_directory_listings()
+
+    def on_save_error(self, error_message: str) -> None:
+        """Handle a failed save."""
+        self.finish_saving()
+        QMessageBox.critical(self, "Error", f"Failed to save archive: {error_message}")
+        self.status_label.setText("Error saving archive.")
+
+    def start_saving(self, saver: ArchiveSaver) -> None:
+        """Run saver in the background, with the window locked until it is done.
+
+        The saver reads pages from the open archive and temp directory, so
+        nothing that would close or replace them can run in the meantime.
+        """
+        self.saver = saver
+        self.main_widget.setEnabled(False)
+        for action in self.file_actions:
+            action.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
 
-                    zip_file.write(file_path, new_name)
+        saver.progress_updated.connect(self.update_progress)
+        saver.start()
 
-            removed_count = len(self.image_files) - len(selected_files)
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Archive saved successfully!\n"
-                f"Saved {len(selected_files)} pages.\n"
-                f"Removed {removed_count} pages.\n"
-                f"File: {save_path}"
-            )
-
-            self.status_label.setText(f"Archive saved: {os.path.basename(save_path)}")
+    def finish_saving(self) -> int:
+        """Unlock the window after a save, returning the number of pages saved."""
+        saver = self.saver
+        assert saver is not None
+        # The result is signalled just before run returns
+        saver.wait()
+        self.saver = None
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save archive: {str(e)}")
-            self.status_label.setText("Error saving archive.")
+        self.progress_bar.setVisible(False)
+        self.main_widget.setEnabled(True)
+        for action in self.file_actions:
+            action.setEnabled(True)
+        return len(saver.selected_pages)
 
     def is_rar_available(self) -> bool:
         """Check if RAR command-line tool is available."""
-        try:
-            # Try to run 'rar' command to see if it's available
-            subprocess.run(['rar'], capture_output=True, text=True, timeout=5)
-            return True
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                # Try alternative RAR executable names
-                subprocess.run(['winrar'], capture_output=True, text=True, timeout=5)
-                return True
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                return False
-
-    def create_rar_archive(self, selected_files: List[str], output_path: str) -> bool:
-        """Create a RAR archive using command-line RAR tool. Returns True if successful."""
-        try:
-            # Create a temporary directory to organize files with proper names
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Copy files with proper page names
-                for i, file_path in enumerate(selected_files):
-                    extension = Path(file_path).suffix
-                    new_name = f"page_{i+1:03d}{extension}"
-                    temp_file = temp_path / new_name
-                    shutil.copy2(file_path, temp_file)
+        if self.rar_available is None:
+            # Look the executables up on PATH once instead of spawning them on every call
+            self.rar_available = shutil.which('rar') is not None or shutil.which('winrar') is not None
+        return self.rar_available
 
-                # Try to create RAR archive
-                rar_commands = ['rar', 'winrar']
-                for rar_cmd in rar_commands:
-                    try:
-                        # RAR command: a = add, -r = recurse subdirectories, -ep1 = exclude base folder from paths
-                        cmd = [rar_cmd, 'a', '-r', '-ep1', str(output_path), str(temp_path / '*')]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                        if result.returncode == 0:
-                            return True
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                        continue
-
-                return False
-
-        except Exception:
-            return False
-
-    def create_new_archive_in_place(self, selected_files: List[str], original_path: str) -> None:
+    def create_new_archive_in_place(self, selected_pages: List[Tuple[str, str]], original_path: str) -> None:
         """Create a new archive in place of the original, with backup. Preserves original format (CBR/CBZ)."""
+        temp_archive: Optional[Path] = None
         try:
-            self.status_label.setText("Creating backup...")
-
             # Create backup file in backups folder
             backup_path = self.get_backup_path(original_path)
             original_file = Path(original_path)
@@ -639,61 +1564,70 @@ Instructions:
                     self.status_label.setText("Save cancelled.")
                     return
 
-            # Create backup
-            shutil.copy2(original_path, backup_path)
-            self.status_label.setText("Creating new archive...")
-
-            # Create temporary file for the new archive with same extension as original
-            temp_archive = original_file.parent / f"{original_file.stem}_temp{original_ext}"
+            # Create temporary file for the new archive with same extension as original,
+            # next to it so it can be swapped in atomically
+            with tempfile.NamedTemporaryFile(dir=original_file.parent, suffix=original_ext, delete=False) as temp:
+                temp_archive = Path(temp.name)
 
+            use_rar = False
             if original_ext == '.cbr':
                 # For CBR files, try to create a true RAR archive first
-                if self.is_rar_available():
-                    self.status_label.setText("Creating RAR archive...")
-                    if self.create_rar_archive(selected_files, str(temp_archive)):
-                        archive_type = "RAR-based CBR"
-                    else:
-                        # If RAR creation fails, fall back to ZIP-based CBR
-                        self.status_label.setText("RAR failed, creating ZIP-based CBR...")
-                        with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                            for i, file_path in enumerate(selected_files):
-                                extension = Path(file_path).suffix
-                                new_name = f"page_{i+1:03d}{extension}"
-                                zip_file.write(file_path, new_name)
-                        archive_type = "ZIP-based CBR"
-                else:
-                    # No RAR tool available, create ZIP-based CBR
+                use_rar = self.is_rar_available()
+                if not use_rar:
                     self.status_label.setText("Creating ZIP-based CBR (no RAR tool found)...")
-                    with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for i, file_path in enumerate(selected_files):
-                            extension = Path(file_path).suffix
-                            new_name = f"page_{i+1:03d}{extension}"
-                            zip_file.write(file_path, new_name)
-                    archive_type = "ZIP-based CBR"
             else:  # CBZ format
                 # For CBZ files, always use ZIP format
                 self.status_label.setText("Creating ZIP archive...")
-                with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for i, file_path in enumerate(selected_files):
-                        # Create a proper filename with page number
-                        extension = Path(file_path).suffix
-                        new_name = f"page_{i+1:03d}{extension}"
-
-                        zip_file.write(file_path, new_name)
-                archive_type = "ZIP-based CBZ"
-
-            # Replace original file with new archive
-            if original_file.exists():
-                original_file.unlink()  # Delete original
-            temp_archive.rename(original_file)  # Rename temp to original
-
-            removed_count = len(self.image_files) - len(selected_files)
-            format_name = "CBR" if original_ext == '.cbr' else "CBZ"
+
+            saver = ArchiveSaver(
+                selected_pages, str(temp_archive), self.archive, self.temp_dir, use_rar,
+                backup=(original_path, backup_path)
+            )
+            saver.save_finished.connect(
+                functools.partial(self.on_save_in_place_finished, original_path, backup_path, temp_archive)
+            )
+            saver.error_occurred.connect(
+                functools.partial(self.on_save_in_place_error, original_path, backup_path, temp_archive)
+            )
+            self.start_saving(saver)
+
+        except Exception as e:
+            # Nothing has been backed up or replaced yet
+            try:
+                if temp_archive is not None and temp_archive.exists():
+                    temp_archive.unlink()
+            except Exception:
+                pass
+
+            QMessageBox.critical(self, "Error", f"Failed to save archive: {str(e)}")
+            self.status_label.setText("Error saving archive.")
+
+    def on_save_in_place_finished(self, original_path: str, backup_path: Path, temp_archive: Path,
+                                  archive_type: str) -> None:
+        """Swap a finished archive in for the original."""
+        selected_count = self.finish_saving()
+        try:
+            original_file = Path(original_path)
+            self.add_to_backup_index(original_path, backup_path)
+
+            # The pages come from the original when it is a CBZ; release it so it
+            # can be replaced, and reload the saved file afterwards
+            reload_pages = self.archive is not None
+            self.close_archive()
+
+            # Replace original file with new archive; the path never goes missing.
+            # The temp file is created 0600, so carry the original's mode over.
+            shutil.copymode(original_file, temp_archive)
+            os.replace(temp_archive, original_file)
+            self.forget_directory_listings()
+
+            removed_count = len(self.image_files) - selected_count
+            format_name = "CBR" if original_file.suffix.lower() == '.cbr' else "CBZ"
             QMessageBox.information(
                 self,
                 "Success",
                 f"Archive saved successfully!\n"
-                f"Saved {len(selected_files)} pages.\n"
+                f"Saved {selected_count} pages.\n"
                 f"Removed {removed_count} pages.\n"
                 f"Format: {format_name} ({archive_type})\n"
                 f"Original backed up to: backups/{backup_path.name}\n"
@@ -703,16 +1637,31 @@ Instructions:
             self.status_label.setText(f"Archive saved in place ({archive_type}). Backup: backups/{backup_path.name}")
             self.update_revert_button()  # Update revert button visibility
 
+            if reload_pages:
+                self.extract_images(original_path)
+
         except Exception as e:
-            # Try to restore from backup if something went wrong
-            try:
-                if backup_path.exists() and not original_file.exists():
-                    shutil.copy2(backup_path, original_path)
-            except Exception:
-                pass
+            self.on_save_in_place_failed(original_path, backup_path, temp_archive, str(e))
 
-            QMessageBox.critical(self, "Error", f"Failed to save archive: {str(e)}")
-            self.status_label.setText("Error saving archive.")
+    def on_save_in_place_error(self, original_path: str, backup_path: Path, temp_archive: Path,
+                               error_message: str) -> None:
+        """Handle an in-place save whose archive could not be written."""
+        self.finish_saving()
+        self.on_save_in_place_failed(original_path, backup_path, temp_archive, error_message)
+
+    def on_save_in_place_failed(self, original_path: str, backup_path: Path, temp_archive: Path,
+                                error_message: str) -> None:
+        """Put the original back if it went missing, and drop the new archive."""
+        try:
+            if backup_path.exists() and not os.path.exists(original_path):
+                copy_file(backup_path, original_path)
+            if temp_archive.exists():
+                temp_archive.unlink()
+        except Exception:
+            pass
+
+        QMessageBox.critical(self, "Error", f"Failed to save archive: {error_message}")
+        self.status_label.setText("Error saving archive.")
 
     def revert_from_backup(self) -> None:
         """Revert the current file from its backup."""
@@ -740,9 +1689,11 @@ Instructions:
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 # Replace current file with backup
+                self.close_archive()
                 if original_file.exists():
                     original_file.unlink()
-                shutil.copy2(backup_path, original_file)
+                copy_file(backup_path, original_file)
+                self.forget_directory_listings()
 
                 QMessageBox.information(
                     self,
@@ -759,47 +1710,79 @@ Instructions:
 
     def get_backup_path(self, original_path: str) -> Path:
         """Get the backup file path in the backups folder."""
-        original_file = Path(original_path)
+        stem, suffix = os.path.splitext(os.path.basename(original_path))
 
-        # Create backups directory in current working directory
-        backup_dir = Path.cwd() / "backups"
+        # Create backups directory on first use
+        backup_dir = self.backup_dir
         backup_dir.mkdir(exist_ok=True)
 
         # Create backup filename with timestamp to avoid conflicts
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"{original_file.stem}_backup_{timestamp}{original_file.suffix}"
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        backup_filename = f"{stem}_backup_{timestamp}{suffix}"
 
         return backup_dir / backup_filename
 
     def get_latest_backup_path(self, original_path: str) -> Optional[Path]:
         """Get the latest backup file path for the given original file."""
-        original_file = Path(original_path)
-        backup_dir = Path.cwd() / "backups"
-
-        if not backup_dir.exists():
+        self.refresh_backup_index()
+        # Timestamps in the names sort chronologically, so the last is the most recent
+        backup_names = self.backup_index.get(os.path.splitext(os.path.basename(original_path)))
+        if not backup_names:
             return None
+        return self.backup_dir / backup_names[-1]
 
-        # Find all backup files for this original file
-        pattern = f"{original_file.stem}_backup_*{original_file.suffix}"
-        backup_files = list(backup_dir.glob(pattern))
+    def refresh_backup_index(self) -> None:
+        """Re-read the backups folder into backup_index if it changed since it was last read."""
+        try:
+            mtime: Optional[int] = os.stat(self.backup_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self.backup_index_mtime:
+            return
 
-        if not backup_files:
-            return None
+        self.backup_index = {}
+        self.backup_index_mtime = mtime
+        if mtime is None:
+            return
 
-        # Return the most recent backup (sorted by filename which includes timestamp)
-        return sorted(backup_files)[-1]
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    match = BACKUP_NAME_PATTERN.fullmatch(entry.name)
+                    if match:
+                        stem, _timestamp, suffix = match.groups()
+                        self.backup_index.setdefault((stem, suffix or ''), []).append(entry.name)
+        except OSError:
+            return
+        for backup_names in self.backup_index.values():
+            backup_names.sort()
+
+    def add_to_backup_index(self, original_path: str, backup_path: Path) -> None:
+        """Record a backup this app just wrote, without re-reading the folder."""
+        key = os.path.splitext(os.path.basename(original_path))
+        backup_names = self.backup_index.setdefault(key, [])
+        if backup_path.name not in backup_names:
+            bisect.insort(backup_names, backup_path.name)
+        try:
+            self.backup_index_mtime = os.stat(self.backup_dir).st_mtime_ns
+        except OSError:
+            pass
 
     def check_backup_exists(self) -> bool:
         """Check if a backup exists for the current file."""
         if not self.current_file:
             return False
 
-        latest_backup = self.get_latest_backup_path(self.current_file)
-        return latest_backup is not None and latest_backup.exists()
+        # The index is re-read whenever the backups folder changes, so a
+        # listed backup exists without statting it again
+        return self.get_latest_backup_path(self.current_file) is not None
 
     def update_revert_button(self) -> None:
         """Update the visibility and state of the revert button."""
         has_backup = self.check_backup_exists()
+        if has_backup == self.revert_state:
+            return
+        self.revert_state = has_backup
         self.revert_button.setVisible(has_backup)
         self.revert_button.setEnabled(has_backup)
 
@@ -818,75 +1801,96 @@ Instructions:
     def cleanup_temp_dir(self) -> None:
         """Clean up temporary directory."""
         if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-            except Exception as e:
-                print(f"Warning: Could not clean up temp directory: {e}")
+            # Unlinking hundreds of pages would hold up navigation and closing.
+            # The thread is not a daemon, so the interpreter waits for it on exit.
+            threading.Thread(target=remove_temp_dir, args=(self.temp_dir,)).start()
         self.temp_dir = None
 
+    def close_archive(self) -> None:
+        """Close the archive pages are being read from."""
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+        if self.zip_handles is not None:
+            self.zip_handles.close()
+            self.zip_handles = None
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """Handle application close event."""
+        if self.saver is not None:
+            # Closing now would leave the new archive half written
+            self.status_label.setText("Please wait for the archive to finish saving.")
+            event.ignore()
+            return
+
+        # Let running thumbnail tasks finish before their files go away
+        self.thumbnail_pool.clear()
+        self.thumbnail_pool.waitForDone()
+
         self.cleanup_temp_dir()
+        self.close_archive()
         event.accept()
 
     def get_comic_files_in_directory(self, file_path: str) -> List[str]:
         """Get all comic book files in the same directory as the given file."""
-        directory = Path(file_path).parent
-        comic_extensions = {'.cbr', '.cbz'}
-        comic_files = []
+        return list(self.get_directory_listing(file_path)[0])
 
+    def get_directory_listing(self, file_path: str) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+        """Get the sorted comic files next to file_path and a map from each to its index.
+
+        The scan is cached until the directory's mtime changes, so the several
+        lookups behind one navigation click cost a stat each.
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
         try:
-            for file in directory.iterdir():
-                if file.is_file() and file.suffix.lower() in comic_extensions:
-                    comic_files.append(str(file.resolve()))  # Use resolved absolute path
-        except Exception:
-            return []
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return (), {}
+        return scan_comic_directory(directory, mtime)
+
+    def forget_directory_listings(self) -> None:
+        """Drop every cached directory listing, for writes that may land within the mtime granularity.
 
-        # Sort files naturally
-        comic_files.sort(key=lambda x: Path(x).name.lower())
-        return comic_files
+        lru_cache can't evict single keys, and the cache is small enough to rebuild.
+        """
+        scan_comic_directory.cache_clear()
 
     def get_current_file_index(self) -> int:
         """Get the index of the current file in the directory listing."""
-        if not self.current_file:
-            return -1
-
-        comic_files = self.get_comic_files_in_directory(self.current_file)
+        return self.get_navigation_state()[1]
 
-        # Normalize current file path for comparison
-        current_file_normalized = str(Path(self.current_file).resolve())
+    def get_navigation_state(self) -> Tuple[Tuple[str, ...], int]:
+        """Get the comic files in the current directory and the current file's index in them."""
+        if not self.current_file:
+            return (), -1
 
-        try:
-            return comic_files.index(current_file_normalized)
-        except ValueError:
-            return -1
+        comic_files, file_indexes = self.get_directory_listing(self.current_file)
+        return comic_files, file_indexes.get(self.current_file_abs, -1)
 
     def update_navigation_buttons(self) -> None:
         """Update the enabled state of navigation buttons."""
-        if not self.current_file:
-            self.prev_button.setEnabled(False)
-            self.next_button.setEnabled(False)
+        prev_enabled = next_enabled = False
+        if self.current_file:
+            comic_files, file_indexes = self.get_directory_listing(self.current_file)
+            # A lone file has nowhere to go, so its index isn't needed
+            if len(comic_files) > 1:
+                current_index = file_indexes.get(self.current_file_abs, -1)
+                if current_index >= 0:
+                    prev_enabled = current_index > 0
+                    next_enabled = current_index < len(comic_files) - 1
+
+        if (prev_enabled, next_enabled) == self.navigation_state:
             return
-
-        comic_files = self.get_comic_files_in_directory(self.current_file)
-        current_index = self.get_current_file_index()
-
-        if current_index >= 0 and len(comic_files) > 1:
-            prev_enabled = current_index > 0
-            next_enabled = current_index < len(comic_files) - 1
-            self.prev_button.setEnabled(prev_enabled)
-            self.next_button.setEnabled(next_enabled)
-        else:
-            self.prev_button.setEnabled(False)
-            self.next_button.setEnabled(False)
+        self.navigation_state = (prev_enabled, next_enabled)
+        self.prev_button.setEnabled(prev_enabled)
+        self.next_button.setEnabled(next_enabled)
 
     def open_previous_file(self) -> None:
         """Open the previous comic file in the directory."""
         if not self.current_file:
             return
 
-        comic_files = self.get_comic_files_in_directory(self.current_file)
-        current_index = self.get_current_file_index()
+        comic_files, current_index = self.get_navigation_state()
 
         if current_index > 0:
             prev_file = comic_files[current_index - 1]
@@ -895,6 +1899,7 @@ Instructions:
             self.prev_button.setText("Loading...")
             self.prev_button.setEnabled(False)
             self.next_button.setEnabled(False)
+            self.navigation_state = (False, False)
 
             # Disable other buttons during navigation
             self.save_button.setEnabled(False)
@@ -904,14 +1909,16 @@ Instructions:
 
             self.current_file = prev_file
             self.extract_images(prev_file)
+            # Readers tend to keep going the same way
+            if current_index > 1:
+                self.prefetch_file(comic_files[current_index - 2])
 
     def open_next_file(self) -> None:
         """Open the next comic file in the directory."""
         if not self.current_file:
             return
 
-        comic_files = self.get_comic_files_in_directory(self.current_file)
-        current_index = self.get_current_file_index()
+        comic_files, current_index = self.get_navigation_state()
 
         if current_index >= 0 and current_index < len(comic_files) - 1:
             next_file = comic_files[current_index + 1]
@@ -920,6 +1927,7 @@ Instructions:
             self.next_button.setText("Loading...")
             self.next_button.setEnabled(False)
             self.prev_button.setEnabled(False)
+            self.navigation_state = (False, False)
 
             # Disable other buttons during navigation
             self.save_button.setEnabled(False)
@@ -929,6 +1937,13 @@ Instructions:
 
             self.current_file = next_file
             self.extract_images(next_file)
+            # Readers tend to keep going the same way
+            if current_index < len(comic_files) - 2:
+                self.prefetch_file(comic_files[current_index + 2])
+
+    def prefetch_file(self, file_path: str) -> None:
+        """Warm the OS cache with file_path in the background while the current file is read."""
+        QThreadPool.globalInstance().start(PrefetchTask(file_path))
 
 def main() -> None:
     """Main function to run the application."""
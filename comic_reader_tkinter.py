@@ -1,3 +1,7 @@
+import functools
+import hashlib
+import io
+import itertools
 import os
 import shutil
 import subprocess
@@ -5,13 +9,170 @@ import sys
 import tempfile
 import zipfile
 import threading
-from datetime import datetime
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import IO, Dict, List, Optional, Callable, Set, Tuple, Union
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from PIL import Image, ImageTk
 import patoolib
+import comic_files
+import zip_entries
+
+# Optional libvips bindings, which shrink JPEGs while decoding them and resize
+# with SIMD; Pillow is used when they are missing or can't read a page
+HAS_PYVIPS = False
+try:
+    import pyvips
+    HAS_PYVIPS = True
+except ImportError:
+    HAS_PYVIPS = False
+
+# Lowercase, with the dot
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+# The same, for checking a whole lowercased name with one str.endswith call
+_IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)
+
+# Formats that are already entropy-coded; DEFLATE saves next to nothing on them
+STORED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+# Largest thumbnail, in pixels; pages are scaled down to fit inside it
+THUMBNAIL_SIZE = (140, 180)
+# Thumbnail grid width, and rows kept decoded above and below the viewport
+PAGE_COLUMNS = 5
+PAGE_BUFFER_ROWS = 2
+# Milliseconds between page updates while scrolling, about one frame at 60 Hz
+SCROLL_UPDATE_INTERVAL = 16
+# Recently shown thumbnails kept as PhotoImages beyond those on screen, about 100 KiB each
+PHOTO_CACHE_SIZE = 200
+
+# Pages read ahead of the ZIP writer while saving, bounding the bytes held at once
+SAVE_READ_AHEAD = 16
+
+# Scaled thumbnails are kept here between runs, one folder per archive version.
+# The Qt reader uses the same folder and layout, so each reuses the other's.
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "cbreader"
+# Least recently opened archives' thumbnails are dropped beyond this many bytes
+THUMBNAIL_CACHE_LIMIT = 256 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _rar_executable() -> Optional[str]:
+    """Find the RAR command-line tool on PATH, once per run instead of spawning it on every check."""
+    return shutil.which('rar') or shutil.which('winrar')
+
+
+def _scan_image_files(directory: str) -> List["os.DirEntry[str]"]:
+    """Collect the entries of image files under directory, recursing into subfolders."""
+    image_entries: List["os.DirEntry[str]"] = []
+    stack = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(_IMAGE_SUFFIXES):
+                    image_entries.append(entry)
+    return image_entries
+
+
+def _natural_sorted(paths: List[str]) -> List[str]:
+    """Sort paths by file name naturally, so page2 comes before page10.
+
+    Keys are built once per path and sorted as tuples rather than per comparison.
+    """
+    keyed = [(comic_files.natural_key(os.path.basename(path)), path) for path in paths]
+    keyed.sort()
+    return [path for _key, path in keyed]
+
+
+def _load_thumbnail(image_path: str, cache_file: Optional[str], zip_handles: Optional["ZipHandlePool"]) -> Image.Image:
+    """Load a page's thumbnail from the disk cache, or decode it and cache it."""
+    if cache_file and os.path.exists(cache_file):
+        try:
+            cached = Image.open(cache_file)
+            cached.load()
+            return cached
+        except OSError:
+            # Unreadable or partly written; decode the page again
+            pass
+
+    pil_image = _decode_thumbnail(image_path, zip_handles)
+    if cache_file:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # JPEG has no alpha or palette modes
+            cache_image = pil_image if pil_image.mode in ('RGB', 'L') else pil_image.convert('RGB')
+            cache_image.save(cache_file, "JPEG", quality=80)
+        except OSError:
+            pass
+    return pil_image
+
+
+def _copy_raw_entry(source: IO[bytes], info: zipfile.ZipInfo, zip_file: zipfile.ZipFile, new_name: str) -> None:
+    """Copy a ZIP entry's compressed bytes from source into zip_file under new_name, without inflating them."""
+    zinfo = zipfile.ZipInfo(new_name, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = info.compress_size
+    zinfo.CRC = info.CRC
+
+    # zipfile can't take pre-compressed data, so write the local header and
+    # payload directly and register the entry for the central directory
+    zip_entries.write_entry(zip_file, zinfo, zip_entries.iter_payload(source, info))
+
+
+def _read_page_for_zip(
+    file_path: str, new_name: str, zip_handles: Optional["ZipHandlePool"]
+) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Read a page's bytes and the entry to store them under. Safe to call from worker threads.
+
+    file_path names an entry in the zip_handles archive when one is given.
+    """
+    if zip_handles is not None:
+        zinfo = zipfile.ZipInfo(new_name, time.localtime()[:6])
+        zinfo.external_attr = 0o600 << 16
+        return zinfo, zip_handles.read(file_path)
+
+    zinfo = zipfile.ZipInfo.from_file(file_path, new_name)
+    with open(file_path, 'rb') as f:
+        return zinfo, f.read()
+
+
+def _decode_thumbnail(image_path: str, zip_handles: Optional["ZipHandlePool"]) -> Image.Image:
+    """Open a page and shrink it to thumbnail size, off the Tk thread.
+
+    image_path names an entry in the zip_handles archive when one is given.
+    """
+    data = zip_handles.read(image_path) if zip_handles is not None else None
+
+    if HAS_PYVIPS:
+        try:
+            return _decode_thumbnail_vips(image_path, data)
+        except pyvips.Error:
+            pass
+
+    pil_image = Image.open(io.BytesIO(data) if data is not None else image_path)
+
+    # Resize to fit while maintaining aspect ratio
+    pil_image.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    return pil_image
+
+
+def _decode_thumbnail_vips(image_path: str, data: Optional[bytes]) -> Image.Image:
+    """Make a page's thumbnail with libvips, returned as a Pillow image for ImageTk."""
+    if data is not None:
+        vips_image = pyvips.Image.thumbnail_buffer(data, THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1], size='down')
+    else:
+        vips_image = pyvips.Image.thumbnail(image_path, THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1], size='down')
+    # 8-bit sRGB or greyscale only; CMYK, 16-bit and the like are converted
+    if vips_image.interpretation not in ('srgb', 'b-w') or vips_image.format != 'uchar':
+        vips_image = vips_image.colourspace('srgb')
+    mode = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}[vips_image.bands]
+    return Image.frombytes(mode, (vips_image.width, vips_image.height), vips_image.write_to_memory())
 
 
 class ImageExtractor:
@@ -22,6 +183,14 @@ class ImageExtractor:
                  error_callback: Callable[[str], None]) -> None:
         self.file_path = file_path
         self.temp_dir: Optional[str] = None
+        # The archive as it was when extracted, to tell if it changed since
+        self.source_stat: Optional[os.stat_result] = None
+        # Open when pages are read straight from a ZIP archive instead of
+        # disk; handed over to the reader, which closes it
+        self.archive: Optional[zipfile.ZipFile] = None
+        # Where each page sits in storage (inode on disk, offset in the
+        # archive), so pages can be read in that order rather than by name
+        self.storage_order: Dict[str, int] = {}
         self.progress_callback = progress_callback
         self.finished_callback = finished_callback
         self.error_callback = error_callback
@@ -33,36 +202,38 @@ class ImageExtractor:
 
     def _run(self) -> None:
         try:
-            self.temp_dir = tempfile.mkdtemp()
-            self.progress_callback(10, "Creating temporary directory...")
+            self.source_stat = os.stat(self.file_path)
 
             # Determine file type and extract
             file_ext = Path(self.file_path).suffix.lower()
 
             if file_ext == '.cbz':
-                self._extract_zip()
+                # CBZ pages are decoded straight from the archive, so nothing
+                # needs to be written to disk
+                self.progress_callback(30, "Reading CBZ file...")
+                self.archive = zipfile.ZipFile(self.file_path, 'r')
+                image_files = self._find_image_entries(self.archive)
             elif file_ext == '.cbr':
+                self.temp_dir = tempfile.mkdtemp()
+                self.progress_callback(10, "Creating temporary directory...")
                 self._extract_rar()
+
+                # Find image files
+                self.progress_callback(80, "Scanning for images...")
+                image_files = self._find_image_files()
             else:
                 self.error_callback(f"Unsupported file format: {file_ext}")
                 return
 
-            # Find image files
-            self.progress_callback(80, "Scanning for images...")
-            image_files = self._find_image_files()
-
             self.progress_callback(100, "Extraction complete!")
             self.finished_callback(image_files)
 
         except Exception as e:
+            if self.archive is not None:
+                self.archive.close()
+                self.archive = None
             self.error_callback(f"Error extracting archive: {str(e)}")
 
-    def _extract_zip(self) -> None:
-        """Extract CBZ (ZIP) file."""
-        self.progress_callback(30, "Extracting CBZ file...")
-        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-            zip_ref.extractall(self.temp_dir)
-
     def _extract_rar(self) -> None:
         """Extract CBR (RAR) file using patool, with fallback to ZIP for ZIP-based CBR files."""
         self.progress_callback(30, "Extracting CBR file...")
@@ -73,44 +244,164 @@ class ImageExtractor:
             # If RAR extraction fails, try ZIP extraction (for ZIP-based CBR files)
             self.progress_callback(40, "Trying ZIP extraction for CBR file...")
             try:
-                with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-                    zip_ref.extractall(self.temp_dir)
+                self._extract_zip_parallel(40)
             except Exception as zip_error:
                 # If both fail, raise a combined error message
                 raise Exception(
                     f"Failed to extract CBR file. RAR error: {str(rar_error)}, ZIP error: {str(zip_error)}"
                 ) from rar_error
 
+    def _extract_zip_parallel(self, start_progress: int) -> None:
+        """Extract the ZIP's image entries into the temp directory across a thread pool.
+
+        zlib releases the GIL while it inflates, so entries decompress on
+        every core instead of one at a time as with extractall().
+        """
+        if not self.temp_dir:
+            return
+
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            members: List[Tuple[zipfile.ZipInfo, str]] = []
+            for info in zip_ref.infolist():
+                # Only pages are looked for afterwards, so nothing else is written
+                if info.is_dir() or Path(info.filename).suffix.lower() not in IMAGE_EXTENSIONS:
+                    continue
+                target = comic_files.member_target(self.temp_dir, info.filename)
+                if target:
+                    members.append((info, target))
+
+        # Create each directory once up front, so workers only write files
+        directories: Set[str] = {os.path.dirname(target) for _info, target in members}
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+
+        total = len(members)
+        done = 0
+        last_progress = start_progress
+        lock = threading.Lock()
+        # ZipFile handles are not safe to share between threads, so each
+        # worker opens its own the first time it runs
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+
+        def extract_member(member: Tuple[zipfile.ZipInfo, str]) -> None:
+            nonlocal done, last_progress
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                zip_ref = zipfile.ZipFile(self.file_path, 'r')
+                local.zip_ref = zip_ref
+                with lock:
+                    handles.append(zip_ref)
+
+            info, target = member
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 16)
+
+            with lock:
+                done += 1
+                # Only report when the bar would move
+                progress = start_progress + done * (80 - start_progress) // total
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_callback(progress, f"Extracting page {done} of {total}...")
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                for _ in executor.map(extract_member, members):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
+
     def _find_image_files(self) -> List[str]:
         """Find all image files in the extracted directory."""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-        image_files: List[str] = []
+        if not self.temp_dir or not os.path.exists(self.temp_dir):
+            return []
 
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            for root, _dirs, files in os.walk(self.temp_dir):
-                for file in files:
-                    if Path(file).suffix.lower() in image_extensions:
-                        image_files.append(os.path.join(root, file))
+        # Sort files naturally, keyed on the names the scan already has.
+        # Inodes come from the directory listing, so recording them is free.
+        keyed = []
+        for entry in _scan_image_files(self.temp_dir):
+            keyed.append((comic_files.natural_key(entry.name), entry.path))
+            self.storage_order[entry.path] = entry.inode()
+        keyed.sort()
+        return [path for _key, path in keyed]
+
+    def _find_image_entries(self, archive: zipfile.ZipFile) -> List[str]:
+        """Find all image entries in the CBZ archive."""
+        image_entries = [
+            info.filename for info in archive.infolist()
+            if not info.is_dir() and Path(info.filename).suffix.lower() in IMAGE_EXTENSIONS
+        ]
+        self.storage_order = {name: archive.getinfo(name).header_offset for name in image_entries}
+
+        # Sort entries naturally
+        return _natural_sorted(image_entries)
+
+
+class ZipHandlePool:
+    """ZipFile handles on one archive, reused across thumbnail workers.
+
+    ZipFile is not safe to share between threads, so each read borrows a
+    handle of its own. Handles are opened on demand, at most one per worker
+    running at once, instead of one per page.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.free: List[zipfile.ZipFile] = []
+        self.closed = False
+
+    def read(self, name: str) -> bytes:
+        """Read one entry using a free handle, opening a new one if none is free."""
+        with self.lock:
+            zip_ref = self.free.pop() if self.free else None
+        if zip_ref is None:
+            zip_ref = zipfile.ZipFile(self.path, 'r')
+
+        try:
+            return zip_ref.read(name)
+        finally:
+            with self.lock:
+                if self.closed:
+                    zip_ref.close()
+                else:
+                    self.free.append(zip_ref)
 
-        # Sort files naturally
-        image_files.sort(key=lambda x: Path(x).name.lower())
-        return image_files
+    def close(self) -> None:
+        """Close the free handles; ones still in use are closed when returned."""
+        with self.lock:
+            self.closed = True
+            for zip_ref in self.free:
+                zip_ref.close()
+            self.free.clear()
 
 
 class PageWidget:
-    """Widget to display a single comic page with selection checkbox."""
+    """Widget to display a single comic page with selection checkbox.
+
+    The selection itself lives in the reader's selected_mask, shared by all
+    pages, at index page_number - 1.
+    """
 
-    def __init__(self, parent: tk.Widget, image_path: str, page_number: int) -> None:
+    def __init__(
+        self, parent: tk.Widget, image_path: str, page_number: int, selected_mask: List[bool], placeholder: tk.PhotoImage
+    ) -> None:
         self.image_path = image_path
         self.page_number = page_number
-        self.selected = True
+        self.selected_mask = selected_mask
+        self.placeholder = placeholder
+        self.photo: Optional[ImageTk.PhotoImage] = None
+        # Set by the reader once the thumbnail is queued, until it is released
+        self.thumbnail_requested = False
 
         # Create frame for this page
         self.frame = tk.Frame(parent, relief=tk.SOLID, borderwidth=1)
         self.frame.configure(width=150, height=200)
 
         # Checkbox for selection
-        self.var = tk.BooleanVar(value=True)
+        self.var = tk.BooleanVar(value=selected_mask[page_number - 1])
         self.checkbox = tk.Checkbutton(
             self.frame,
             text=f"Page {page_number}",
@@ -119,37 +410,36 @@ class PageWidget:
         )
         self.checkbox.pack()
 
-        # Image label
-        self.image_label = tk.Label(self.frame)
+        # Image label; the thumbnail is decoded in the background and set later.
+        # Until then a blank image the thumbnail's size keeps the row its final height.
+        self.image_label = tk.Label(self.frame, text="Loading...", image=placeholder, compound=tk.CENTER)
         self.image_label.pack(expand=True, fill=tk.BOTH)
 
-        # Load and display thumbnail
-        self._load_thumbnail()
-
         # Update initial appearance
         self._on_selection_changed()
 
-    def _load_thumbnail(self) -> None:
-        """Load and display a thumbnail of the image."""
-        try:
-            # Open image with PIL
-            pil_image = Image.open(self.image_path)
-            
-            # Resize to fit while maintaining aspect ratio
-            pil_image.thumbnail((140, 180), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage for tkinter
-            self.photo = ImageTk.PhotoImage(pil_image)
-            self.image_label.configure(image=self.photo)
-            
-        except Exception as e:
-            self.image_label.configure(text=f"Error: {str(e)}", image="")
+    def set_thumbnail(self, photo: ImageTk.PhotoImage) -> None:
+        """Display a thumbnail of the image."""
+        # Keep a reference, Tk drops the image once the PhotoImage is collected
+        self.photo = photo
+        self.image_label.configure(image=self.photo, text="")
+
+    def set_thumbnail_error(self, error: Exception) -> None:
+        """Show why the thumbnail could not be loaded."""
+        self.image_label.configure(text=f"Error: {str(error)}", image="")
+
+    def release_thumbnail(self) -> None:
+        """Drop the thumbnail to free its memory; it is loaded again when next needed."""
+        self.photo = None
+        self.thumbnail_requested = False
+        self.image_label.configure(text="Loading...", image=self.placeholder)
 
     def _on_selection_changed(self) -> None:
         """Handle checkbox state change."""
-        self.selected = self.var.get()
+        selected = self.var.get()
+        self.selected_mask[self.page_number - 1] = selected
         # Change appearance based on selection
-        if self.selected:
+        if selected:
             self.frame.configure(bg="white")
             self.checkbox.configure(bg="white")
             self.image_label.configure(bg="white")
@@ -160,10 +450,13 @@ class PageWidget:
 
     def is_selected(self) -> bool:
         """Return whether this page is selected."""
-        return self.selected
+        return self.selected_mask[self.page_number - 1]
 
     def set_selected(self, selected: bool) -> None:
         """Set the selection state."""
+        if selected == self.var.get():
+            # Already styled for it, skip the Tk round trips
+            return
         self.var.set(selected)
         self._on_selection_changed()
 
@@ -175,8 +468,46 @@ class ComicBookReader:
         self.root = tk.Tk()
         self.current_file: Optional[str] = None
         self.temp_dir: Optional[str] = None
+        # The archive the pages in temp_dir came from, and its stat then
+        self.source_path: Optional[str] = None
+        self.source_stat: Optional[os.stat_result] = None
+        # Open CBZ that image_files are read from, None when they are extracted to disk
+        self.archive: Optional[zipfile.ZipFile] = None
+        # Handles on the same archive for the thumbnail workers
+        self.zip_handles: Optional[ZipHandlePool] = None
         self.image_files: List[str] = []
+        # Storage position of each page, from ImageExtractor.storage_order
+        self.page_storage_order: Dict[str, int] = {}
         self.page_widgets: List[PageWidget] = []
+        # One flag per page, True to keep it; written by the page widgets
+        self.selected_mask: List[bool] = []
+
+        # Thumbnails are decoded and scaled on worker threads (Pillow releases
+        # the GIL while it does both); only PhotoImages are made on the Tk thread
+        self.thumbnail_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Queued and running decodes, by page index
+        self.thumbnail_futures: Dict[int, Future] = {}
+        # Thumbnails from a previous _load_pages call are ignored by generation
+        self.thumbnail_generation = 0
+        # Set once the window is closing; decodes finishing after that leave Tk alone
+        self.closing = False
+        self.thumbnail_cache_dir: Optional[str] = None
+        # Thumbnails shown lately, oldest first, by (thumbnail cache folder, page
+        # name); kept across loads, so scrolling back or reopening a file is instant
+        self.photo_cache: "OrderedDict[Tuple[str, str], ImageTk.PhotoImage]" = OrderedDict()
+        # Shown in place of thumbnails that aren't decoded, shared by every page
+        self.placeholder_photo = tk.PhotoImage(width=THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1])
+
+        # Only pages near the viewport are built and hold thumbnails; rows are a
+        # fixed height, measured on the first one, so the scroll region is exact
+        self.page_row_height = 0
+        self.page_row_count = 0
+        self.scroll_update_job: Optional[str] = None
+
+        # Keep the on-disk thumbnail cache bounded, without delaying startup
+        threading.Thread(
+            target=comic_files.prune_thumbnail_cache, args=(THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_LIMIT), daemon=True
+        ).start()
 
         self._init_ui()
 
@@ -292,7 +623,7 @@ class ComicBookReader:
         )
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_canvas_scrolled)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -380,6 +711,7 @@ class ComicBookReader:
 
         # Clean up previous temp directory
         self._cleanup_temp_dir()
+        self._close_archive()
 
         # Create and start extraction
         self.extractor = ImageExtractor(
@@ -410,6 +742,13 @@ class ComicBookReader:
         self.progress_bar.pack_forget()
         self.image_files = image_files
         self.temp_dir = self.extractor.temp_dir
+        self.source_path = self.extractor.file_path
+        self.source_stat = self.extractor.source_stat
+        self.page_storage_order = self.extractor.storage_order
+        if self.extractor.archive is not None:
+            # Reuse the extractor's handle rather than parsing the central directory again
+            self.archive = self.extractor.archive
+            self.zip_handles = ZipHandlePool(self.extractor.file_path)
 
         # Reset navigation button text
         self.prev_button.configure(text="◀ Previous")
@@ -464,28 +803,170 @@ class ComicBookReader:
         for widget in self.page_widgets:
             widget.frame.destroy()
         self.page_widgets.clear()
+        self._cancel_thumbnails()
+        self.thumbnail_generation += 1
+        self.thumbnail_cache_dir = self._get_thumbnail_cache_dir()
+
+        if self.page_row_count:
+            # Let the last file's rows collapse
+            self.scrollable_frame.grid_rowconfigure(tuple(range(self.page_row_count)), minsize=0)
+        self.page_row_height = 0
+        self.page_row_count = 0
+        self.selected_mask = [True] * len(self.image_files)
+        self.canvas.yview_moveto(0)
+
+        # Configure grid weights for proper resizing
+        for col in range(PAGE_COLUMNS):
+            self.scrollable_frame.grid_columnconfigure(col, weight=1)
+
+        # Only the rows in view are built now; the rest follow as they are scrolled to
+        self._update_visible_pages()
+
+    def _on_canvas_scrolled(self, first: Union[str, float], last: Union[str, float]) -> None:
+        """Move the scroll bar, and queue _update_visible_pages unless it is already due."""
+        self.scrollbar.set(first, last)
+        if self.page_widgets and self.scroll_update_job is None:
+            self.scroll_update_job = self.root.after(SCROLL_UPDATE_INTERVAL, self._update_visible_pages)
+
+    def _update_visible_pages(self) -> None:
+        """Build pages down to the viewport, queue thumbnails near it and release the rest."""
+        self.scroll_update_job = None
+        if not self.image_files:
+            return
 
-        # Create page widgets in a grid layout
-        columns = 5  # Number of columns in grid
-        for i, image_path in enumerate(self.image_files):
-            page_widget = PageWidget(self.scrollable_frame, image_path, i + 1)
+        if not self.page_widgets:
+            # Build the first row to measure it, then reserve room for every
+            # row so the scroll bar spans the whole archive
+            self._build_pages(PAGE_COLUMNS)
+            self.scrollable_frame.update_idletasks()
+            self.page_row_height = self.page_widgets[0].frame.winfo_reqheight() + 10  # pady above and below
+            self.page_row_count = (len(self.image_files) + PAGE_COLUMNS - 1) // PAGE_COLUMNS
+            self.scrollable_frame.grid_rowconfigure(tuple(range(self.page_row_count)), minsize=self.page_row_height)
+
+        top = int(self.canvas.canvasy(0))
+        bottom = int(self.canvas.canvasy(self.canvas.winfo_height()))
+        start = max(top // self.page_row_height - PAGE_BUFFER_ROWS, 0) * PAGE_COLUMNS
+        end = min((bottom // self.page_row_height + 1 + PAGE_BUFFER_ROWS) * PAGE_COLUMNS, len(self.image_files))
+        self._build_pages(end)
+
+        for i, widget in enumerate(self.page_widgets):
+            if widget.thumbnail_requested and not start <= i < end:
+                future = self.thumbnail_futures.pop(i, None)
+                if future is not None:
+                    future.cancel()
+                widget.release_thumbnail()
+
+        # Queue the thumbnails in storage order, so the pages are read
+        # sequentially off the disk; each still lands on its own widget
+        storage_order = self.page_storage_order
+        indexes = [i for i in range(start, end) if not self.page_widgets[i].thumbnail_requested]
+        indexes.sort(key=lambda i: storage_order.get(self.image_files[i], 0))
+        for i in indexes:
+            self._request_thumbnail(i)
+
+    def _build_pages(self, count: int) -> None:
+        """Build widgets for the pages up to count, continuing from the last one built."""
+        for i in range(len(self.page_widgets), min(count, len(self.image_files))):
+            page_widget = PageWidget(
+                self.scrollable_frame, self.image_files[i], i + 1, self.selected_mask, self.placeholder_photo
+            )
             self.page_widgets.append(page_widget)
+            page_widget.frame.grid(row=i // PAGE_COLUMNS, column=i % PAGE_COLUMNS, padx=5, pady=5, sticky="nsew")
+
+    def _request_thumbnail(self, index: int) -> None:
+        """Show a page's thumbnail from photo_cache, or queue it to be decoded on the thread pool."""
+        image_path = self.image_files[index]
+        page_widget = self.page_widgets[index]
+        page_widget.thumbnail_requested = True
+
+        cache_key = None
+        cache_file = None
+        if self.thumbnail_cache_dir:
+            # Key on the page's name inside the archive, the temp dir changes every load
+            if self.archive is not None:
+                page_name = image_path
+            else:
+                page_name = os.path.relpath(image_path, self.temp_dir or "").replace(os.sep, '/')
+            cache_key = (self.thumbnail_cache_dir, page_name)
+            photo = self.photo_cache.get(cache_key)
+            if photo is not None:
+                self.photo_cache.move_to_end(cache_key)
+                page_widget.set_thumbnail(photo)
+                return
+            cache_file = os.path.join(self.thumbnail_cache_dir, f"{hashlib.sha1(page_name.encode()).hexdigest()}.jpg")
 
-            row = i // columns
-            col = i % columns
-            page_widget.frame.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
+        future = self.thumbnail_executor.submit(_load_thumbnail, image_path, cache_file, self.zip_handles)
+        self.thumbnail_futures[index] = future
+        future.add_done_callback(
+            functools.partial(self._on_thumbnail_decoded, self.thumbnail_generation, index, cache_key)
+        )
 
-        # Configure grid weights for proper resizing
-        for col in range(columns):
-            self.scrollable_frame.grid_columnconfigure(col, weight=1)
+    def _get_thumbnail_cache_dir(self) -> Optional[str]:
+        """Get the thumbnail cache folder for the current file, keyed by path, mtime and size."""
+        if not self.current_file:
+            return None
+
+        try:
+            stat = os.stat(self.current_file)
+        except OSError:
+            return None
+
+        key = f"{os.path.abspath(self.current_file)}|{stat.st_mtime}|{stat.st_size}"
+        cache_dir = str(THUMBNAIL_CACHE_DIR / hashlib.sha1(key.encode()).hexdigest())
+        try:
+            # Mark as recently used for comic_files.prune_thumbnail_cache
+            os.utime(cache_dir)
+        except OSError:
+            pass
+        return cache_dir
+
+    def _cancel_thumbnails(self) -> None:
+        """Drop thumbnails that are still waiting to be decoded."""
+        for future in self.thumbnail_futures.values():
+            future.cancel()
+        self.thumbnail_futures.clear()
+
+    def _on_thumbnail_decoded(
+        self, generation: int, index: int, cache_key: Optional[Tuple[str, str]], future: Future
+    ) -> None:
+        """Handle a decoded thumbnail (worker thread)."""
+        if future.cancelled() or self.closing:
+            return
+        # Use after() to ensure thread-safe GUI updates
+        self.root.after(0, lambda: self._on_thumbnail_decoded_gui(generation, index, cache_key, future))
+
+    def _on_thumbnail_decoded_gui(
+        self, generation: int, index: int, cache_key: Optional[Tuple[str, str]], future: Future
+    ) -> None:
+        """Show a decoded thumbnail on its page (GUI thread)."""
+        if generation != self.thumbnail_generation or self.thumbnail_futures.get(index) is not future:
+            # From an earlier file, or the page was scrolled away from and released
+            return
+        del self.thumbnail_futures[index]
+
+        page_widget = self.page_widgets[index]
+        try:
+            # Convert to PhotoImage for tkinter
+            photo = ImageTk.PhotoImage(future.result())
+        except Exception as e:
+            page_widget.set_thumbnail_error(e)
+            return
+
+        if cache_key is not None:
+            self.photo_cache[cache_key] = photo
+            if len(self.photo_cache) > PHOTO_CACHE_SIZE:
+                self.photo_cache.popitem(last=False)
+        page_widget.set_thumbnail(photo)
 
     def _select_all_pages(self) -> None:
         """Select all pages."""
+        self.selected_mask[:] = [True] * len(self.selected_mask)
         for widget in self.page_widgets:
             widget.set_selected(True)
 
     def _select_no_pages(self) -> None:
         """Deselect all pages."""
+        self.selected_mask[:] = [False] * len(self.selected_mask)
         for widget in self.page_widgets:
             widget.set_selected(False)
 
@@ -495,7 +976,7 @@ class ComicBookReader:
             return
 
         total_pages = len(self.image_files)
-        selected_pages = sum(1 for widget in self.page_widgets if widget.is_selected())
+        selected_pages = sum(self.selected_mask)
 
         # Determine file format and archive capabilities
         original_ext = Path(self.current_file).suffix.lower()
@@ -531,10 +1012,7 @@ Instructions:
             messagebox.showwarning("Warning", "No pages loaded.")
             return
 
-        selected_files = []
-        for i, widget in enumerate(self.page_widgets):
-            if widget.is_selected():
-                selected_files.append(self.image_files[i])
+        selected_files = list(itertools.compress(self.image_files, self.selected_mask))
 
         if not selected_files:
             messagebox.showwarning("Warning", "No pages selected. Please select at least one page.")
@@ -576,10 +1054,7 @@ Instructions:
             messagebox.showwarning("Warning", "No pages loaded.")
             return
 
-        selected_files = []
-        for i, widget in enumerate(self.page_widgets):
-            if widget.is_selected():
-                selected_files.append(self.image_files[i])
+        selected_files = list(itertools.compress(self.image_files, self.selected_mask))
 
         if not selected_files:
             messagebox.showwarning("Warning", "No pages selected. Please select at least one page.")
@@ -602,6 +1077,10 @@ Instructions:
         )
 
         if save_path:
+            if self.archive is not None and os.path.abspath(save_path) == os.path.abspath(self.current_file):
+                # Pages are still being read from this file, so it can't be rewritten here
+                messagebox.showwarning("Warning", "Use 'Save In Place' to overwrite the open file.")
+                return
             self._create_new_archive(selected_files, save_path)
 
     def _create_new_archive(self, selected_files: List[str], save_path: str) -> None:
@@ -610,12 +1089,7 @@ Instructions:
             self.status_label.configure(text="Creating new archive...")
 
             with zipfile.ZipFile(save_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for i, file_path in enumerate(selected_files):
-                    # Create a proper filename with page number
-                    extension = Path(file_path).suffix
-                    new_name = f"page_{i+1:03d}{extension}"
-
-                    zip_file.write(file_path, new_name)
+                self._write_pages_to_zip(zip_file, selected_files)
 
             removed_count = len(self.image_files) - len(selected_files)
             messagebox.showinfo(
@@ -632,22 +1106,91 @@ Instructions:
             messagebox.showerror("Error", f"Failed to save archive: {str(e)}")
             self.status_label.configure(text="Error saving archive.")
 
+    def _write_pages_to_zip(self, zip_file: zipfile.ZipFile, selected_files: List[str]) -> None:
+        """Write the selected pages to zip_file as page_NNN entries, in order.
+
+        Pages from the open CBZ, or extracted from a ZIP archive that hasn't
+        changed since, are copied from it still compressed instead of being
+        deflated again. Other pages are deflated only if their format isn't
+        compressed already.
+        """
+        source_zip = self.archive if self.archive is not None else self._open_source_zip()
+        source_fp = source_zip.fp if source_zip is not None else None
+        try:
+            # (file_path, new_name, compress_type, entry to copy raw or None)
+            plan: List[Tuple[str, str, int, Optional[zipfile.ZipInfo]]] = []
+            for i, file_path in enumerate(selected_files):
+                # Create a proper filename with page number
+                extension = Path(file_path).suffix
+                new_name = f"page_{i+1:03d}{extension}"
+                if extension.lower() in STORED_EXTENSIONS:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+
+                info = None
+                if self.archive is not None:
+                    info = self.archive.getinfo(file_path)
+                elif source_zip is not None and self.temp_dir:
+                    # _extract_zip_parallel put each entry at its own name under temp_dir
+                    member = os.path.relpath(file_path, self.temp_dir).replace(os.sep, '/')
+                    info = source_zip.NameToInfo.get(member)
+                if source_fp is None or info is None or info.flag_bits & 0x1:
+                    info = None
+                plan.append((file_path, new_name, compress_type, info))
+
+            # Other pages are read on worker threads, overlapping their IO,
+            # while entries are still written here one at a time, in order
+            to_read = iter([index for index, page in enumerate(plan) if page[3] is None])
+            reads: Dict[int, Future] = {}
+            zip_handles = self.zip_handles
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                def read_ahead() -> None:
+                    index = next(to_read, None)
+                    if index is not None:
+                        file_path, new_name = plan[index][:2]
+                        reads[index] = executor.submit(_read_page_for_zip, file_path, new_name, zip_handles)
+
+                for _ in range(SAVE_READ_AHEAD):
+                    read_ahead()
+
+                for index, (file_path, new_name, compress_type, info) in enumerate(plan):
+                    if info is not None:
+                        # No entry is open, so the archive's own file handle is free to read from
+                        assert source_fp is not None
+                        _copy_raw_entry(source_fp, info, zip_file, new_name)
+                        continue
+
+                    zinfo, data = reads.pop(index).result()
+                    read_ahead()
+                    zip_file.writestr(zinfo, data, compress_type=compress_type)
+        finally:
+            if source_zip is not None and source_zip is not self.archive:
+                source_zip.close()
+
+    def _open_source_zip(self) -> Optional[zipfile.ZipFile]:
+        """Open the archive the pages were extracted from, if it is a ZIP and unchanged since."""
+        if not self.source_path or self.source_stat is None:
+            return None
+        try:
+            stat = os.stat(self.source_path)
+            if (stat.st_mtime_ns, stat.st_size) != (self.source_stat.st_mtime_ns, self.source_stat.st_size):
+                # Saved over (maybe with the same entry names), so its entries may not match the pages
+                return None
+            return zipfile.ZipFile(self.source_path, 'r')
+        except (OSError, zipfile.BadZipFile):
+            return None
+
     def _is_rar_available(self) -> bool:
         """Check if RAR command-line tool is available."""
-        try:
-            # Try to run 'rar' command to see if it's available
-            subprocess.run(['rar'], capture_output=True, text=True, timeout=5)
-            return True
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            try:
-                # Try alternative RAR executable names
-                subprocess.run(['winrar'], capture_output=True, text=True, timeout=5)
-                return True
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                return False
+        return _rar_executable() is not None
 
     def _create_rar_archive(self, selected_files: List[str], output_path: str) -> bool:
         """Create a RAR archive using command-line RAR tool. Returns True if successful."""
+        rar_executable = _rar_executable()
+        if rar_executable is None:
+            return False
+
         try:
             # Create a temporary directory to organize files with proper names
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -658,22 +1201,19 @@ Instructions:
                     extension = Path(file_path).suffix
                     new_name = f"page_{i+1:03d}{extension}"
                     temp_file = temp_path / new_name
-                    shutil.copy2(file_path, temp_file)
+                    if self.archive is not None:
+                        temp_file.write_bytes(self.archive.read(file_path))
+                    else:
+                        shutil.copy2(file_path, temp_file)
 
                 # Try to create RAR archive
-                rar_commands = ['rar', 'winrar']
-                for rar_cmd in rar_commands:
-                    try:
-                        # RAR command: a = add, -r = recurse subdirectories, -ep1 = exclude base folder from paths
-                        cmd = [rar_cmd, 'a', '-r', '-ep1', str(output_path), str(temp_path / '*')]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                        if result.returncode == 0:
-                            return True
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                        continue
-
-                return False
+                try:
+                    # RAR command: a = add, -r = recurse subdirectories, -ep1 = exclude base folder from paths
+                    cmd = [rar_executable, 'a', '-r', '-ep1', str(output_path), str(temp_path / '*')]
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                    return result.returncode == 0
+                except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+                    return False
 
         except Exception:
             return False
@@ -715,32 +1255,26 @@ Instructions:
                         # If RAR creation fails, fall back to ZIP-based CBR
                         self.status_label.configure(text="RAR failed, creating ZIP-based CBR...")
                         with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                            for i, file_path in enumerate(selected_files):
-                                extension = Path(file_path).suffix
-                                new_name = f"page_{i+1:03d}{extension}"
-                                zip_file.write(file_path, new_name)
+                            self._write_pages_to_zip(zip_file, selected_files)
                         archive_type = "ZIP-based CBR"
                 else:
                     # No RAR tool available, create ZIP-based CBR
                     self.status_label.configure(text="Creating ZIP-based CBR (no RAR tool found)...")
                     with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for i, file_path in enumerate(selected_files):
-                            extension = Path(file_path).suffix
-                            new_name = f"page_{i+1:03d}{extension}"
-                            zip_file.write(file_path, new_name)
+                        self._write_pages_to_zip(zip_file, selected_files)
                     archive_type = "ZIP-based CBR"
             else:  # CBZ format
                 # For CBZ files, always use ZIP format
                 self.status_label.configure(text="Creating ZIP archive...")
                 with zipfile.ZipFile(temp_archive, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for i, file_path in enumerate(selected_files):
-                        # Create a proper filename with page number
-                        extension = Path(file_path).suffix
-                        new_name = f"page_{i+1:03d}{extension}"
-
-                        zip_file.write(file_path, new_name)
+                    self._write_pages_to_zip(zip_file, selected_files)
                 archive_type = "ZIP-based CBZ"
 
+            # The pages come from the original when it is a CBZ; release it so it
+            # can be replaced, and reload the saved file afterwards
+            reload_pages = self.archive is not None
+            self._close_archive()
+
             # Replace original file with new archive
             if original_file.exists():
                 original_file.unlink()  # Delete original
@@ -761,6 +1295,9 @@ Instructions:
             self.status_label.configure(text=f"Archive saved in place ({archive_type}). Backup: backups/{backup_path.name}")
             self._update_revert_button()  # Update revert button visibility
 
+            if reload_pages:
+                self._extract_images(original_path)
+
         except Exception as e:
             # Try to restore from backup if something went wrong
             try:
@@ -795,6 +1332,7 @@ Instructions:
         if result:
             try:
                 # Replace current file with backup
+                self._close_archive()
                 if original_file.exists():
                     original_file.unlink()
                 shutil.copy2(backup_path, original_file)
@@ -820,7 +1358,7 @@ Instructions:
         backup_dir.mkdir(exist_ok=True)
 
         # Create backup filename with timestamp to avoid conflicts
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_filename = f"{original_file.stem}_backup_{timestamp}{original_file.suffix}"
 
         return backup_dir / backup_filename
@@ -830,18 +1368,10 @@ Instructions:
         original_file = Path(original_path)
         backup_dir = Path.cwd() / "backups"
 
-        if not backup_dir.exists():
-            return None
-
-        # Find all backup files for this original file
+        # Return the most recent backup of this original file (largest
+        # filename, which includes the timestamp), or None if there are none
         pattern = f"{original_file.stem}_backup_*{original_file.suffix}"
-        backup_files = list(backup_dir.glob(pattern))
-
-        if not backup_files:
-            return None
-
-        # Return the most recent backup (sorted by filename which includes timestamp)
-        return sorted(backup_files)[-1]
+        return max(backup_dir.glob(pattern), key=lambda path: path.name, default=None)
 
     def _check_backup_exists(self) -> bool:
         """Check if a backup exists for the current file."""
@@ -880,22 +1410,34 @@ Instructions:
                 print(f"Warning: Could not clean up temp directory: {e}")
         self.temp_dir = None
 
+    def _close_archive(self) -> None:
+        """Close the archive pages are being read from."""
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+        if self.zip_handles is not None:
+            self.zip_handles.close()
+            self.zip_handles = None
+
     def _get_comic_files_in_directory(self, file_path: str) -> List[str]:
         """Get all comic book files in the same directory as the given file."""
-        directory = Path(file_path).parent
+        directory = os.path.dirname(os.path.abspath(file_path))
         comic_extensions = {'.cbr', '.cbz'}
-        comic_files = []
+        # (lowercased name, path) pairs: each name is lowered once and the
+        # sort compares plain tuples, case-insensitively by name
+        named_files = []
 
         try:
-            for file in directory.iterdir():
-                if file.is_file() and file.suffix.lower() in comic_extensions:
-                    comic_files.append(str(file.resolve()))  # Use resolved absolute path
-        except Exception:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    lower_name = entry.name.lower()
+                    if lower_name[-4:] in comic_extensions and entry.is_file():
+                        named_files.append((lower_name, os.path.join(directory, entry.name)))
+        except OSError:
             return []
 
-        # Sort files naturally
-        comic_files.sort(key=lambda x: Path(x).name.lower())
-        return comic_files
+        named_files.sort()
+        return [path for _name, path in named_files]
 
     def _get_current_file_index(self) -> int:
         """Get the index of the current file in the directory listing."""
@@ -904,8 +1446,8 @@ Instructions:
 
         comic_files = self._get_comic_files_in_directory(self.current_file)
 
-        # Normalize current file path for comparison
-        current_file_normalized = str(Path(self.current_file).resolve())
+        # Normalize current file path the same way the listing is built
+        current_file_normalized = os.path.abspath(self.current_file)
 
         try:
             return comic_files.index(current_file_normalized)
@@ -983,12 +1525,28 @@ Instructions:
         """Run the application."""
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         self.root.mainloop()
+        self._shutdown()
 
     def _on_closing(self) -> None:
         """Handle application close event."""
-        self._cleanup_temp_dir()
+        self.closing = True
+        self._cancel_thumbnails()
         self.root.destroy()
 
+    def _shutdown(self) -> None:
+        """Stop thumbnail decoding and release the open file, once the main loop has exited.
+
+        A decode finishing now calls after() from its worker. Tk only runs that
+        on this thread, so waiting for the workers from inside the main loop
+        would deadlock; out here the call fails instead of blocking.
+        """
+        self.closing = True
+        self._cancel_thumbnails()
+        # Let running decodes finish before their files go away
+        self.thumbnail_executor.shutdown(wait=True)
+        self._cleanup_temp_dir()
+        self._close_archive()
+
 
 def main() -> None:
     """Main function to run the application."""
@@ -0,0 +1,72 @@
+"""Tests for the CBR to CBZ converter."""
+
+import io
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+import cbr2cbz
+
+# rarfile's compress_type for stored members
+RAR_M0 = 0x30
+
+
+class FakeRarInfo:
+    """The parts of rarfile.RarInfo the converter reads."""
+
+    def __init__(self, filename: str, data: bytes) -> None:
+        self.filename = filename
+        self.data = data
+        self.file_size = len(data)
+        self.date_time = (2020, 1, 1, 0, 0, 0)
+        self.compress_type = RAR_M0
+
+    def is_dir(self) -> bool:
+        return False
+
+
+class FakeRarFile:
+    """An in-memory stand-in for rarfile.RarFile."""
+
+    members: Dict[str, bytes] = {}
+
+    def __init__(self, path: str) -> None:
+        self.infos = [FakeRarInfo(name, data) for name, data in self.members.items()]
+
+    def __enter__(self) -> "FakeRarFile":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def infolist(self) -> List[FakeRarInfo]:
+        return self.infos
+
+    def is_solid(self) -> bool:
+        return False
+
+    def open(self, info: FakeRarInfo) -> io.BytesIO:
+        return io.BytesIO(info.data)
+
+
+@pytest.mark.unit
+def test_extract_and_pack_sorts_pages_naturally(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    FakeRarFile.members = {
+        'sub/p1.jpg': b'sub1',
+        'p10.jpg': b'ten',
+        'notes.txt': b'skip me',
+        'p2.jpg': b'two',
+    }
+    monkeypatch.setattr(cbr2cbz, 'HAS_RARFILE', True)
+    monkeypatch.setattr(cbr2cbz, 'rarfile', SimpleNamespace(RarFile=FakeRarFile, RAR_M0=RAR_M0), raising=False)
+
+    cbz_path = tmp_path / 'book.cbz'
+    converter = cbr2cbz.CBRToCBZConverter(create_backups=False)
+    assert converter._extract_and_pack(tmp_path / 'book.cbr', cbz_path)
+
+    with zipfile.ZipFile(cbz_path) as cbz:
+        assert cbz.namelist() == ['p2.jpg', 'p10.jpg', 'sub/p1.jpg']
+        assert cbz.read('p10.jpg') == b'ten'
@@ -0,0 +1,77 @@
+"""Low-level ZIP entry helpers shared by the readers and cbr2cbz.
+
+zipfile has no public way to locate an entry's payload or to add data that
+is already compressed, so these lean on its private local header layout
+and bookkeeping, kept here in one place.
+"""
+
+import os
+import struct
+import zipfile
+from typing import IO, Iterable, Iterator
+
+# Fixed-size part of a local file header, and where its name and extra field
+# lengths sit; private in zipfile and untyped
+_STRUCT_FILE_HEADER: str = zipfile.structFileHeader  # type: ignore[attr-defined]
+LOCAL_HEADER_SIZE: int = zipfile.sizeFileHeader  # type: ignore[attr-defined]
+_FH_FILENAME_LENGTH: int = zipfile._FH_FILENAME_LENGTH  # type: ignore[attr-defined]
+_FH_EXTRA_FIELD_LENGTH: int = zipfile._FH_EXTRA_FIELD_LENGTH  # type: ignore[attr-defined]
+
+# Chunk size for copying payloads across
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def local_header_size(header: bytes) -> int:
+    """Full size of a local file header, given its first LOCAL_HEADER_SIZE bytes.
+
+    The name and extra field lengths can differ from the central directory's,
+    so they are read from the local header itself.
+    """
+    fields = struct.unpack(_STRUCT_FILE_HEADER, header[:LOCAL_HEADER_SIZE])
+    name_length: int = fields[_FH_FILENAME_LENGTH]
+    extra_length: int = fields[_FH_EXTRA_FIELD_LENGTH]
+    return LOCAL_HEADER_SIZE + name_length + extra_length
+
+
+def seek_payload(source: IO[bytes], info: zipfile.ZipInfo) -> None:
+    """Position source, the archive's file, at the start of info's compressed payload."""
+    source.seek(info.header_offset)
+    header = source.read(LOCAL_HEADER_SIZE)
+    source.seek(local_header_size(header) - LOCAL_HEADER_SIZE, os.SEEK_CUR)
+
+
+def iter_payload(source: IO[bytes], info: zipfile.ZipInfo) -> Iterator[bytes]:
+    """Yield info's compressed payload from source in chunks, without inflating it."""
+    seek_payload(source, info)
+    remaining = info.compress_size
+    while remaining > 0:
+        chunk = source.read(min(remaining, COPY_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated entry {info.filename!r}")
+        yield chunk
+        remaining -= len(chunk)
+
+
+def write_entry(zip_file: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: Iterable[bytes]) -> None:
+    """Append an entry whose payload is already in its stored form.
+
+    zinfo must carry the final compress_type, sizes and CRC.
+    """
+    fp = zip_file.fp
+    assert fp is not None, "zip_file is closed"
+    zinfo.header_offset = fp.tell()
+    # FileHeader adds the ZIP64 extra field itself when the sizes need it
+    fp.write(zinfo.FileHeader())
+    for chunk in payload:
+        fp.write(chunk)
+    register_entry(zip_file, zinfo)
+
+
+def register_entry(zip_file: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> None:
+    """Record an entry written by hand so zipfile emits it in the central directory."""
+    fp = zip_file.fp
+    assert fp is not None, "zip_file is closed"
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+    zip_file.start_dir = fp.tell()
+    zip_file._didModify = True  # type: ignore[attr-defined]